@@ -4,12 +4,22 @@ from __future__ import annotations
 
 __all__ = ["__version__", "EditorApplication", "EditorMainWindow"]
 
-try:
-    from .gui import EditorApplication, EditorMainWindow
-except ModuleNotFoundError as exc:
-    if exc.name != "PySide6":
-        raise
-    EditorApplication = None
-    EditorMainWindow = None
-
 __version__ = "0.1.0.dev0"
+
+_GUI_EXPORTS = frozenset({"EditorApplication", "EditorMainWindow"})
+
+
+def __getattr__(name: str):
+    # The GUI pulls in PySide6, which dominates start-up time. Import it on
+    # first access so ``--version``/``--check`` stay lightweight.
+    if name not in _GUI_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        from .gui import EditorApplication, EditorMainWindow
+    except ModuleNotFoundError as exc:
+        if exc.name != "PySide6":
+            raise
+        EditorApplication = None
+        EditorMainWindow = None
+    globals().update(EditorApplication=EditorApplication, EditorMainWindow=EditorMainWindow)
+    return globals()[name]
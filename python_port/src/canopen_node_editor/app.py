@@ -2,21 +2,26 @@
 
 from __future__ import annotations
 
-import argparse
+import os
 import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Sequence
-
-from platformdirs import PlatformDirs
+from typing import TYPE_CHECKING, Sequence
 
 from . import __version__
-from .services.network import NetworkManager
-from .services.profiles import ProfileRepository
-from .services.settings import SettingsManager
+
+if TYPE_CHECKING:
+    import argparse
+
+_KNOWN_FLAGS = frozenset({"--check", "--version"})
+
+# Resolved once at import; symlink resolution costs several syscalls.
+_MODULE_PATH = Path(__file__).resolve()
+_MODULE_PARENTS = tuple(_MODULE_PATH.parents)
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class ApplicationPaths:
     """Container for well-known application paths.
 
@@ -30,7 +35,8 @@ class ApplicationPaths:
     data_dir: Path
 
 
-def resolve_paths(base_dir: Path | None = None) -> ApplicationPaths:
+@lru_cache(maxsize=None)
+def resolve_paths(base_dir: Path | str | None = None) -> ApplicationPaths:
     """Return the standard path layout for the application.
 
     Parameters
@@ -40,36 +46,111 @@ def resolve_paths(base_dir: Path | None = None) -> ApplicationPaths:
         directories up from this file. This keeps the bootstrap environment
         consistent whether the package is installed in editable or regular
         mode.
+
+    Results are cached per ``base_dir`` for the life of the process: repeated
+    calls do not probe the file system again, so directories created after the
+    first call are not picked up until restart.
     """
 
     explicit_root = base_dir is not None
     if explicit_root:
         root = Path(base_dir)
     else:
-        module_path = Path(__file__).resolve()
         root = None
-        for candidate in module_path.parents:
-            config_candidate = candidate / "config"
-            data_candidate = candidate / "data"
-            if config_candidate.exists() and data_candidate.exists():
+        for candidate in _MODULE_PARENTS:
+            if (candidate / "config").exists() and (candidate / "data").exists():
                 root = candidate
                 break
         if root is None:
-            root = module_path.parent
+            root = _MODULE_PATH.parent
 
     config_dir = root / "config"
     data_dir = root / "data"
 
     if not explicit_root and (not config_dir.exists() or not data_dir.exists()):
-        dirs = PlatformDirs("CANopenNodeEditor", "OpenAI")
-        config_dir = Path(dirs.user_config_dir)
-        data_dir = Path(dirs.user_data_dir)
+        config_dir, data_dir = _user_dirs()
 
     return ApplicationPaths(root_dir=root, config_dir=config_dir, data_dir=data_dir)
 
 
+def _paths_cache_file() -> Path:
+    # Mirrors platformdirs' user_cache_dir conventions so finding the cache does
+    # not itself require importing platformdirs.
+    if sys.platform == "win32":
+        cache_home = os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local"
+    elif sys.platform == "darwin":
+        cache_home = Path.home() / "Library" / "Caches"
+    else:
+        cache_home = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "canopen_node_editor" / "paths.json"
+
+
+def _user_dirs_key() -> dict[str, str]:
+    """Return the inputs PlatformDirs derives the user directories from."""
+
+    key = {"platform": sys.platform, "home": str(Path.home())}
+    for name in ("XDG_CONFIG_HOME", "XDG_DATA_HOME", "APPDATA", "LOCALAPPDATA"):
+        key[name] = os.environ.get(name, "")
+    return key
+
+
+def _user_dirs() -> tuple[Path, Path]:
+    """Return the per-user config and data directories.
+
+    The PlatformDirs lookup is persisted to a small JSON file after the first
+    run so later start-ups read it back instead of importing platformdirs. The
+    file records the environment it was computed from and is ignored once that
+    changes.
+    """
+
+    import json
+
+    cache_file = _paths_cache_file()
+    key = _user_dirs_key()
+    try:
+        cached = json.loads(cache_file.read_bytes())
+        if cached["key"] == key:
+            return Path(cached["config_dir"]), Path(cached["data_dir"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    from platformdirs import PlatformDirs
+
+    dirs = PlatformDirs("CANopenNodeEditor", "OpenAI")
+    config_dir = Path(dirs.user_config_dir)
+    data_dir = Path(dirs.user_data_dir)
+
+    payload = json.dumps(
+        {"key": key, "config_dir": str(config_dir), "data_dir": str(data_dir)}
+    )
+    try:
+        import tempfile
+
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=cache_file.parent, suffix=".tmp", delete=False
+        ) as temporary:
+            temporary.write(payload)
+        try:
+            os.replace(temporary.name, cache_file)
+        except OSError:
+            os.unlink(temporary.name)
+            raise
+    except OSError:
+        pass
+    return config_dir, data_dir
+
+
 def _build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(description="Launch the CANopenNode Editor GUI")
+    # argparse is only needed for ``--help`` and error reporting; importing it
+    # unconditionally would add noticeably to every CLI start-up.
+    import argparse
+
+    # Prefixes such as ``--vers`` must be rejected: ``main`` dispatches on the
+    # literal flags, so an abbreviation argparse accepted would be ignored.
+    parser = argparse.ArgumentParser(
+        description="Launch the CANopenNode Editor GUI", allow_abbrev=False
+    )
     parser.add_argument(
         "--check",
         action="store_true",
@@ -96,15 +177,21 @@ def main(argv: Sequence[str] | None = None) -> int:
     """Entry point for launching the Qt application."""
 
     normalised_argv = _normalise_argv(argv)
-    parser = _build_parser()
-    args = parser.parse_args(normalised_argv[1:])
+    flags = set(normalised_argv[1:])
+    if not flags <= _KNOWN_FLAGS:
+        # Delegate ``--help`` and invalid arguments to argparse, which prints
+        # the usage text and exits.
+        _build_parser().parse_args(normalised_argv[1:])
 
-    if args.version:
+    if "--version" in flags:
         print(__version__)
         return 0
 
     paths = resolve_paths()
-    if args.check:
+    # Services are imported lazily so ``--version`` avoids loading them.
+    from .services.settings import SettingsManager
+
+    if "--check" in flags:
         # Resolving the paths and loading settings is sufficient to ensure the
         # application can start once Qt dependencies are available.
         settings = SettingsManager()
@@ -122,6 +209,9 @@ def main(argv: Sequence[str] | None = None) -> int:
     storage_dir = paths.config_dir / "user"
     storage_dir.mkdir(parents=True, exist_ok=True)
 
+    from .services.network import NetworkManager
+    from .services.profiles import ProfileRepository
+
     settings = SettingsManager(storage_dir=storage_dir)
     network = NetworkManager()
 
@@ -3,7 +3,14 @@ from .c7h import (
     export_c7h,
     export_canopennode_sources,
     export_header,
+    export_many,
     export_source,
 )
 
-__all__ = ["export_c7h", "export_header", "export_source", "export_canopennode_sources"]
+__all__ = [
+    "export_c7h",
+    "export_header",
+    "export_source",
+    "export_canopennode_sources",
+    "export_many",
+]
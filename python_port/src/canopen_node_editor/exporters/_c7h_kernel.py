@@ -0,0 +1,79 @@
+"""Typed C emission helpers used by :mod:`.c7h`.
+
+The module only uses constructs supported by mypyc so it can be compiled with
+``mypyc src/canopen_node_editor/exporters/_c7h_kernel.py``; the pure-Python
+module is used when no compiled build is present.
+"""
+from __future__ import annotations
+
+import re
+from typing import Callable, Final
+
+from ..model import ObjectEntry, ObjectType, SubObject
+from ..model.enums import DataType
+
+_LABEL_FORMAT: Final = "OD_%04X"
+
+_C_TYPE_MAP: dict[DataType, str] = {
+    DataType.BOOLEAN: "uint8_t",
+    DataType.INTEGER8: "int8_t",
+    DataType.INTEGER16: "int16_t",
+    DataType.INTEGER32: "int32_t",
+    DataType.UNSIGNED8: "uint8_t",
+    DataType.UNSIGNED16: "uint16_t",
+    DataType.UNSIGNED32: "uint32_t",
+    DataType.REAL32: "float",
+    DataType.REAL64: "double",
+    DataType.UNSIGNED64: "uint64_t",
+    DataType.INTEGER64: "int64_t",
+}
+
+# Flat lookup table indexed by ``DataType.value``; avoids hashing the enum for
+# every entry and sub-object during export.
+_C_TYPE_ARR: list[str] = ["uint32_t"] * (max(member.value for member in DataType) + 1)
+for _data_type, _c_type in _C_TYPE_MAP.items():
+    _C_TYPE_ARR[_data_type.value] = _c_type
+
+# ``\W`` matches exactly the characters rejected by ``str.isalnum`` (apart from
+# the underscore, which maps to itself), so substitution runs in C.
+_UNSAFE_CHARS_RE: Final = re.compile(r"\W")
+
+
+def write_declaration(write: Callable[[str], object], entry: ObjectEntry) -> None:
+    label = _LABEL_FORMAT % entry.index
+    if entry.object_type == ObjectType.VAR:
+        write("extern %s %s;\n" % (resolve_c_type(entry), label))
+        return
+
+    write("\ntypedef struct {\n")
+    for subindex, sub in entry.sorted_sub_items():
+        write("    %s %s; /* sub%d */\n" % (resolve_c_type(sub), safe_name(sub.name), subindex))
+    write("} %s_t;\nextern %s_t %s;\n" % (label, label, label))
+
+
+def write_definition(write: Callable[[str], object], entry: ObjectEntry) -> None:
+    label = _LABEL_FORMAT % entry.index
+    if entry.object_type == ObjectType.VAR:
+        value = entry.value or entry.default or "0"
+        write("%s %s = %s;\n" % (resolve_c_type(entry), label, value))
+        return
+
+    write("\n%s_t %s = {\n" % (label, label))
+    for subindex, sub in entry.sorted_sub_items():
+        value = sub.value or sub.default or "0"
+        write("    .%s = %s,\n" % (safe_name(sub.name), value))
+    write("};\n")
+
+
+def resolve_c_type(entry: ObjectEntry | SubObject) -> str:
+    data_type = entry.data_type
+    if data_type is None:
+        return "uint32_t"
+    return _C_TYPE_ARR[data_type._value_]
+
+
+def safe_name(name: str) -> str:
+    candidate = _UNSAFE_CHARS_RE.sub('_', name)
+    if candidate and candidate[0].isdigit():
+        candidate = f'_{candidate}'
+    return candidate or 'unnamed'
@@ -1,12 +1,13 @@
 """CANopenNode source generation helpers."""
 from __future__ import annotations
 
+import re
 from datetime import UTC, datetime
-from io import StringIO
 from pathlib import Path
+from typing import Mapping, TextIO, overload
 
-from ..model import Device, ObjectEntry, ObjectType, SubObject
-from ..model.enums import DataType
+from ..model import Device
+from ._c7h_kernel import write_declaration, write_definition
 
 HEADER_COMMENT = """/*
  * CANopenNode object dictionary header
@@ -22,62 +23,116 @@ SOURCE_COMMENT = """/*
 
 HEADER_INCLUDE = "#include <stdint.h>\n\n"
 
+# Templates split around the placeholder once so exports avoid str.format.
+_HEADER_PREFIX, _HEADER_SUFFIX = HEADER_COMMENT.split("{timestamp}")
+_SOURCE_PREFIX, _SOURCE_SUFFIX = SOURCE_COMMENT.split("{timestamp}")
+
+_GUARD_INVALID = re.compile(r"\W")
+
 DEFAULT_HEADER_NAME = "CO_OD.h"
 DEFAULT_SOURCE_NAME = "CO_OD.c"
 
-_C_TYPE_MAP: dict[DataType, str] = {
-    DataType.BOOLEAN: "uint8_t",
-    DataType.INTEGER8: "int8_t",
-    DataType.INTEGER16: "int16_t",
-    DataType.INTEGER32: "int32_t",
-    DataType.UNSIGNED8: "uint8_t",
-    DataType.UNSIGNED16: "uint16_t",
-    DataType.UNSIGNED32: "uint32_t",
-    DataType.REAL32: "float",
-    DataType.REAL64: "double",
-    DataType.UNSIGNED64: "uint64_t",
-    DataType.INTEGER64: "int64_t",
-}
-
-
-def export_header(device: Device, header_name: str = DEFAULT_HEADER_NAME) -> str:
-    """Render the CANopenNode dictionary header for ``device``."""
-
-    timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%SZ")
+@overload
+def export_header(
+    device: Device,
+    header_name: str = ...,
+    sink: None = None,
+    timestamp: str | None = None,
+) -> str: ...
+
+
+@overload
+def export_header(
+    device: Device,
+    header_name: str = ...,
+    *,
+    sink: TextIO,
+    timestamp: str | None = None,
+) -> None: ...
+
+
+def export_header(
+    device: Device,
+    header_name: str = DEFAULT_HEADER_NAME,
+    sink: TextIO | None = None,
+    timestamp: str | None = None,
+) -> str | None:
+    """Render the CANopenNode dictionary header for ``device``.
+
+    When ``sink`` is given the header is written to it directly and ``None``
+    is returned; otherwise the rendered text is returned. ``timestamp``
+    defaults to the current UTC time.
+    """
+
+    if timestamp is None:
+        timestamp = _timestamp()
     guard = _make_include_guard(header_name)
 
-    buffer = StringIO()
-    buffer.write(HEADER_COMMENT.format(timestamp=timestamp))
-    buffer.write(f"#ifndef {guard}\n")
-    buffer.write(f"#define {guard}\n\n")
-    buffer.write(HEADER_INCLUDE)
+    chunks: list[str] = []
+    write = chunks.append if sink is None else sink.write
+    write(_HEADER_PREFIX)
+    write(timestamp)
+    write(_HEADER_SUFFIX)
+    write("#ifndef %s\n#define %s\n\n" % (guard, guard))
+    write(HEADER_INCLUDE)
 
     for entry in device.all_entries():
-        buffer.write(_format_declaration(entry))
+        write_declaration(write, entry)
 
-    buffer.write("\n")
-    buffer.write(f"#endif /* {guard} */\n")
-    return buffer.getvalue()
+    write("\n#endif /* %s */\n" % guard)
+    return "".join(chunks) if sink is None else None
+
+
+@overload
+def export_source(
+    device: Device,
+    header_name: str = ...,
+    source_name: str = ...,
+    sink: None = None,
+    timestamp: str | None = None,
+) -> str: ...
+
+
+@overload
+def export_source(
+    device: Device,
+    header_name: str = ...,
+    source_name: str = ...,
+    *,
+    sink: TextIO,
+    timestamp: str | None = None,
+) -> None: ...
 
 
 def export_source(
     device: Device,
     header_name: str = DEFAULT_HEADER_NAME,
     source_name: str = DEFAULT_SOURCE_NAME,
-) -> str:
-    """Render the CANopenNode dictionary source for ``device``."""
+    sink: TextIO | None = None,
+    timestamp: str | None = None,
+) -> str | None:
+    """Render the CANopenNode dictionary source for ``device``.
+
+    When ``sink`` is given the source is written to it directly and ``None``
+    is returned; otherwise the rendered text is returned. ``timestamp``
+    defaults to the current UTC time.
+    """
 
-    timestamp = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%SZ")
+    if timestamp is None:
+        timestamp = _timestamp()
     header_path = Path(header_name).name
 
-    buffer = StringIO()
-    buffer.write(SOURCE_COMMENT.format(timestamp=timestamp))
-    buffer.write(f'#include "{header_path}"\n\n')
+    chunks: list[str] = []
+    write = chunks.append if sink is None else sink.write
+    write(_SOURCE_PREFIX)
+    write(timestamp)
+    write(_SOURCE_SUFFIX)
+    write('#include "%s"\n\n' % header_path)
 
     for entry in device.all_entries():
-        buffer.write(_format_definition(entry))
+        write_definition(write, entry)
 
-    return buffer.getvalue()
+    return "".join(chunks) if sink is None else None
 
 
 def export_canopennode_sources(
@@ -87,10 +142,47 @@ def export_canopennode_sources(
 ) -> dict[str, str]:
     """Return mapping of filenames to rendered CANopenNode artefacts."""
 
-    return {
-        header_name: export_header(device, header_name=header_name),
-        source_name: export_source(device, header_name=header_name, source_name=source_name),
-    }
+    return _render_sources(device, header_name, source_name, _timestamp())
+
+
+def export_many(
+    devices: Mapping[str, Device],
+    output_dir: Path,
+    header_name: str = DEFAULT_HEADER_NAME,
+    source_name: str = DEFAULT_SOURCE_NAME,
+    max_workers: int | None = None,
+) -> dict[str, dict[str, Path]]:
+    """Export several devices, rendering them in parallel worker processes.
+
+    Each device is written to ``output_dir / name`` where ``name`` is its key
+    in ``devices``. Returns the written paths per device name.
+    """
+
+    output_dir = Path(output_dir)
+    names = list(devices)
+    timestamp = _timestamp()
+    jobs = [(devices[name], header_name, source_name, timestamp) for name in names]
+
+    if len(jobs) > 1 and max_workers != 1:
+        # Imported here so single-device exports and the GUI do not pay for it.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rendered = list(executor.map(_render_job, jobs, chunksize=4))
+    else:
+        rendered = [_render_job(job) for job in jobs]
+
+    exports: dict[str, dict[str, Path]] = {}
+    for name, files in zip(names, rendered):
+        destination_dir = output_dir / name
+        destination_dir.mkdir(parents=True, exist_ok=True)
+        written: dict[str, Path] = {}
+        for filename, content in files.items():
+            destination = destination_dir / filename
+            destination.write_text(content, encoding="utf-8")
+            written[filename] = destination
+        exports[name] = written
+    return exports
 
 
 def export_c7h(device: Device) -> str:
@@ -104,56 +196,25 @@ def export_c7h(device: Device) -> str:
     return export_header(device)
 
 
-def _format_declaration(entry: ObjectEntry) -> str:
-    label = f"OD_{entry.index:04X}"
-    if entry.object_type == ObjectType.VAR:
-        c_type = _resolve_c_type(entry)
-        return f"extern {c_type} {label};\n"
-
-    struct_name = f"{label}_t"
-    lines = ["\n", "typedef struct {\n"]
-    for subindex, sub in sorted(entry.sub_objects.items()):
-        c_type = _resolve_c_type(sub)
-        field_name = _safe_name(sub.name)
-        lines.append(f"    {c_type} {field_name}; /* sub{subindex} */\n")
-    lines.append(f"}} {struct_name};\n")
-    lines.append(f"extern {struct_name} {label};\n")
-    return "".join(lines)
-
-
-def _format_definition(entry: ObjectEntry) -> str:
-    label = f"OD_{entry.index:04X}"
-    if entry.object_type == ObjectType.VAR:
-        c_type = _resolve_c_type(entry)
-        value = entry.value or entry.default or "0"
-        return f"{c_type} {label} = {value};\n"
-
-    struct_name = f"{label}_t"
-    lines = ["\n", f"{struct_name} {label} = {{\n"]
-    for subindex, sub in sorted(entry.sub_objects.items()):
-        field_name = _safe_name(sub.name)
-        value = sub.value or sub.default or "0"
-        lines.append(f"    .{field_name} = {value},\n")
-    lines.append("};\n")
-    return "".join(lines)
+def _render_sources(
+    device: Device, header_name: str, source_name: str, timestamp: str
+) -> dict[str, str]:
+    return {
+        header_name: export_header(device, header_name=header_name, timestamp=timestamp),
+        source_name: export_source(
+            device, header_name=header_name, source_name=source_name, timestamp=timestamp
+        ),
+    }
 
 
-def _resolve_c_type(entry: ObjectEntry | SubObject) -> str:
-    data_type = entry.data_type
-    if data_type is None:
-        return "uint32_t"
-    return _C_TYPE_MAP.get(data_type, "uint32_t")
+def _render_job(job: tuple[Device, str, str, str]) -> dict[str, str]:
+    # Module-level so it can be pickled for ProcessPoolExecutor workers.
+    return _render_sources(*job)
 
 
-def _safe_name(name: str) -> str:
-    filtered = [ch if ch.isalnum() else '_' for ch in name]
-    candidate = ''.join(filtered)
-    if candidate and candidate[0].isdigit():
-        candidate = f'_{candidate}'
-    return candidate or 'unnamed'
+def _timestamp() -> str:
+    return datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%SZ")
 
 
 def _make_include_guard(filename: str) -> str:
-    stem = Path(filename).name.upper()
-    safe = [ch if ch.isalnum() else '_' for ch in stem]
-    return "".join(safe)
+    return _GUARD_INVALID.sub("_", Path(filename).name.upper())
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Iterable, Sequence
 
 from PySide6.QtCore import QLocale, QTranslator
@@ -50,14 +52,16 @@ class EditorApplication(QApplication):
         self._translator = QTranslator(self)
         self._translator_installed = False
         self._locales = list(available_locales or [QLocale.system()])
+        self._translation_index = self._index_translations()
+        self._translation_paths: dict[str, str | None] = {}
 
         icon = self.style().standardIcon(QStyle.StandardPixmap.SP_ComputerIcon)
         if not icon.isNull():
             self.setWindowIcon(icon)
 
-        preferences = self._settings.load()
-        self._apply_theme(preferences)
-        self._install_translator(preferences)
+        self._preferences = self._settings.load()
+        self._apply_theme(self._preferences)
+        self._install_translator(self._preferences)
 
     # ------------------------------------------------------------------
     # Theme management
@@ -79,13 +83,17 @@ class EditorApplication(QApplication):
             self.setStyleSheet("")
 
     def set_theme(self, theme_key: str) -> None:
-        preferences = self._settings.update_preferences(theme=theme_key)
-        self._apply_theme(preferences)
+        self._preferences = self._settings.update_preferences(theme=theme_key)
+        self._apply_theme(self._preferences)
         self._settings.save()
 
     # ------------------------------------------------------------------
     # Localisation support
     def _install_translator(self, preferences: UserPreferences) -> None:
+        if not self._translation_index:
+            # No translations directory exists, so no locale can ever match.
+            return
+
         locale = self._resolve_locale(preferences)
         if not locale:
             return
@@ -104,29 +112,47 @@ class EditorApplication(QApplication):
             return QLocale(preferences.window_state["locale"])
         return self._locales[0] if self._locales else None
 
+    def _translation_dirs(self) -> list[Path]:
+        return [self._settings.storage_path.parent / "translations"]
+
+    def _index_translations(self) -> dict[Path, frozenset[str]]:
+        # A single listdir per directory replaces a stat() per locale candidate.
+        index: dict[Path, frozenset[str]] = {}
+        for base in self._translation_dirs():
+            try:
+                index[base] = frozenset(os.listdir(base))
+            except OSError:
+                continue
+        return index
+
     def _translation_path(self, locale: QLocale) -> str | None:
         # Translation packs are optional. The method returns the first matching
         # resource if it exists.
-        locale_names = [locale.name(), locale.name().split("_")[0]]
-        base_paths = []
-        settings_path = self._settings.storage_path.parent / "translations"
-        base_paths.append(settings_path)
+        locale_name = locale.name()
+        if locale_name in self._translation_paths:
+            return self._translation_paths[locale_name]
 
-        for base in base_paths:
+        locale_names = [locale_name, locale_name.split("_")[0]]
+        resolved: str | None = None
+        for base, available in self._translation_index.items():
             for name in locale_names:
-                candidate = base / f"canopen_node_editor_{name}.qm"
-                if candidate.exists():
-                    return str(candidate)
-        return None
+                filename = f"canopen_node_editor_{name}.qm"
+                if filename in available:
+                    resolved = str(base / filename)
+                    break
+            if resolved is not None:
+                break
+        self._translation_paths[locale_name] = resolved
+        return resolved
 
     # ------------------------------------------------------------------
     # Convenience helpers
     def toggle_theme(self) -> None:
-        current = self._settings.load().theme
-        if current == "dark":
+        if self._preferences.theme == "dark":
             self.set_theme("light")
         else:
             self.set_theme("dark")
 
     def reload_preferences(self) -> None:
-        self._apply_theme(self._settings.load())
+        self._preferences = self._settings.load()
+        self._apply_theme(self._preferences)
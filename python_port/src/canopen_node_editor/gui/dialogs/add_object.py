@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QStandardItem, QStandardItemModel
 from PySide6.QtWidgets import (
     QComboBox,
     QDialog,
@@ -27,6 +29,29 @@ class ObjectEntryRequest:
     access_type: AccessType
 
 
+# (label, value) pairs are fixed by the enums, so build them once at import.
+_OBJECT_TYPE_ITEMS = tuple((value.name.title(), value) for value in ObjectType)
+_DATA_TYPE_ITEMS = tuple((value.name, value) for value in DataType)
+_ACCESS_TYPE_ITEMS = tuple((value.name, value) for value in AccessType)
+
+
+def _build_combo(parent, items: tuple[tuple[str, object], ...], default) -> QComboBox:
+    """Return a combo box whose items are populated in a single model swap."""
+
+    combo = QComboBox(parent)
+    model = QStandardItemModel(len(items), 1, combo)
+    default_index = 0
+    for position, (label, value) in enumerate(items):
+        item = QStandardItem(label)
+        item.setData(value, Qt.UserRole)
+        model.setItem(position, item)
+        if value is default:
+            default_index = position
+    combo.setModel(model)
+    combo.setCurrentIndex(default_index)
+    return combo
+
+
 class AddObjectDialog(QDialog):
     """Prompt the user for basic object dictionary entry details."""
 
@@ -39,23 +64,13 @@ class AddObjectDialog(QDialog):
 
         self._name_edit = QLineEdit(self)
 
-        self._object_type = QComboBox(self)
-        for value in ObjectType:
-            self._object_type.addItem(value.name.title(), value)
-        default_object = ObjectType.VAR
-        self._object_type.setCurrentIndex(self._object_type.findData(default_object))
-
-        self._data_type = QComboBox(self)
-        for value in DataType:
-            self._data_type.addItem(value.name, value)
-        default_data = DataType.UNSIGNED32
-        self._data_type.setCurrentIndex(self._data_type.findData(default_data))
-
-        self._access_type = QComboBox(self)
-        for value in AccessType:
-            self._access_type.addItem(value.name, value)
-        default_access = AccessType.RW
-        self._access_type.setCurrentIndex(self._access_type.findData(default_access))
+        self._object_type = _build_combo(self, _OBJECT_TYPE_ITEMS, ObjectType.VAR)
+        self._data_type = _build_combo(self, _DATA_TYPE_ITEMS, DataType.UNSIGNED32)
+        self._access_type = _build_combo(self, _ACCESS_TYPE_ITEMS, AccessType.RW)
+        self._default_indexes = [
+            (combo, combo.currentIndex())
+            for combo in (self._object_type, self._data_type, self._access_type)
+        ]
 
         form = QFormLayout(self)
         form.addRow(self.tr("Index"), self._index_edit)
@@ -98,6 +113,16 @@ class AddObjectDialog(QDialog):
         )
         self.accept()
 
+    def reset(self) -> None:
+        """Clear previous input so the dialog can be shown again."""
+
+        self._index_edit.clear()
+        self._name_edit.clear()
+        for combo, index in self._default_indexes:
+            combo.setCurrentIndex(index)
+        self._result = None
+        self._index_edit.setFocus()
+
     def request(self) -> ObjectEntryRequest | None:
         """Return the captured object definition if the dialog was accepted."""
 
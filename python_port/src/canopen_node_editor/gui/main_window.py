@@ -24,10 +24,21 @@ from .dialogs import AddObjectDialog
 from .widgets.command_palette import Command, CommandPalette
 from .widgets.device_page import DeviceEditorPage
 
+# Skip per-entry icon lookups and symlink resolution, which stall file dialogs
+# on slow or network-mounted file systems.
+_FILE_DIALOG_OPTIONS = (
+    QFileDialog.Option.DontUseCustomDirectoryIcons | QFileDialog.Option.DontResolveSymlinks
+)
+
+
+_NO_PAGE: tuple[None, None] = (None, None)
+
 
 class EditorMainWindow(QMainWindow):
     """Main window providing menus, docks, and the device workspace."""
 
+    MAX_RECENT_FILES = 10
+
     def __init__(
         self,
         network: NetworkManager,
@@ -42,6 +53,8 @@ class EditorMainWindow(QMainWindow):
         self._profile_repository = profile_repository or ProfileRepository([])
         self._toggle_theme = toggle_theme
         self._palette: CommandPalette | None = None
+        self._add_object_dialog: AddObjectDialog | None = None
+        self._shown_profiles: list | None = None
 
         self.setWindowTitle(self.tr("CANopenNode Editor"))
         self.resize(1280, 720)
@@ -52,7 +65,8 @@ class EditorMainWindow(QMainWindow):
         self._tabs.tabCloseRequested.connect(self._close_tab)
         self.setCentralWidget(self._tabs)
 
-        self._pages: Dict[DeviceEditorPage, DeviceSession] = {}
+        # Keyed by ``id(page)`` so tab lookups avoid isinstance checks.
+        self._pages: Dict[int, tuple[DeviceEditorPage, DeviceSession]] = {}
 
         self._status = QStatusBar(self)
         self.setStatusBar(self._status)
@@ -73,7 +87,16 @@ class EditorMainWindow(QMainWindow):
         self._action_open.setShortcut(QKeySequence.StandardKey.Open)
         self._action_open.triggered.connect(self._open_device_dialog)
 
+        # Fixed pool of recent-file actions; refreshing only relabels them.
         self._action_recent: list[QAction] = []
+        for _ in range(self.MAX_RECENT_FILES):
+            action = QAction(self)
+            action.setVisible(False)
+            action.triggered.connect(self._on_recent_triggered)
+            self._action_recent.append(action)
+        self._action_no_recent = QAction(self.tr("No recent files"), self)
+        self._action_no_recent.setEnabled(False)
+        self._recent_names: dict[str, str] = {}
 
         self._action_export = QAction(self.tr("Export CANopenNode Sources…"), self)
         self._action_export.setShortcut("Ctrl+E")
@@ -104,6 +127,8 @@ class EditorMainWindow(QMainWindow):
         file_menu.addAction(self._action_new)
         file_menu.addAction(self._action_open)
         self._recent_menu = file_menu.addMenu(self.tr("Open &Recent"))
+        self._recent_menu.addActions(self._action_recent)
+        self._recent_menu.addAction(self._action_no_recent)
         file_menu.addSeparator()
         file_menu.addAction(self._action_export)
         file_menu.addSeparator()
@@ -128,7 +153,7 @@ class EditorMainWindow(QMainWindow):
 
     # ------------------------------------------------------------------
     def _restore_window_state(self) -> None:
-        prefs = self._settings.load()
+        prefs = self._settings.cached_preferences()
         state = prefs.window_state
         geometry = state.get("geometry")
         dock_state = state.get("dock_state")
@@ -147,11 +172,14 @@ class EditorMainWindow(QMainWindow):
         geometry = bytes(self.saveGeometry().toBase64()).decode("ascii")
         dock_state = bytes(self.saveState().toBase64()).decode("ascii")
         locale = QLocale.system().name()
-        self._settings.update_preferences(window_state={
+        window_state = {
             "geometry": geometry,
             "dock_state": dock_state,
             "locale": locale,
-        })
+        }
+        if self._settings.cached_preferences().window_state == window_state:
+            return
+        self._settings.update_preferences(window_state=window_state)
         self._settings.save()
 
     # ------------------------------------------------------------------
@@ -162,6 +190,7 @@ class EditorMainWindow(QMainWindow):
             self.tr("Open Device"),
             str(directory),
             self.tr("Device Descriptions (*.eds *.xdd *.xdc)"),
+            options=_FILE_DIALOG_OPTIONS,
         )
         if not path:
             return
@@ -179,9 +208,18 @@ class EditorMainWindow(QMainWindow):
     def _add_session(self, session: DeviceSession) -> None:
         page = DeviceEditorPage(session.device, self)
         page.addEntryRequested.connect(self._add_object_entry)
-        index = self._tabs.addTab(page, session.identifier)
-        self._pages[page] = session
-        self._tabs.setCurrentIndex(index)
+        page.issuesChanged.connect(self._update_context_widgets)
+        # currentChanged would refresh the context widgets for the intermediate
+        # tab states; do it once after the new tab is in place instead.
+        blocked = self._tabs.blockSignals(True)
+        page.setUpdatesEnabled(False)
+        try:
+            index = self._tabs.addTab(page, session.identifier)
+            self._pages[id(page)] = (page, session)
+            self._tabs.setCurrentIndex(index)
+        finally:
+            self._tabs.blockSignals(blocked)
+            page.setUpdatesEnabled(True)
         self._update_context_widgets()
         self._offer_mandatory_object_fix(page, session)
 
@@ -195,25 +233,22 @@ class EditorMainWindow(QMainWindow):
             self._close_tab(index)
 
     def _close_tab(self, index: int) -> None:
-        widget = self._tabs.widget(index)
-        page = widget if isinstance(widget, DeviceEditorPage) else None
-        session = self._pages.pop(page, None) if page else None
+        _page, session = self._pages.pop(id(self._tabs.widget(index)), _NO_PAGE)
         if session is not None:
             self._network.close_device(session.identifier)
         self._tabs.removeTab(index)
         self._update_context_widgets()
 
     def _export_current_session(self) -> None:
-        index = self._tabs.currentIndex()
-        if index < 0:
-            return
-        widget = self._tabs.currentWidget()
-        page = widget if isinstance(widget, DeviceEditorPage) else None
-        session = self._pages.get(page) if page else None
+        session = self._current_session()
         if session is None:
             return
         session_id = session.identifier
-        output_dir = QFileDialog.getExistingDirectory(self, self.tr("Select Output Directory"))
+        output_dir = QFileDialog.getExistingDirectory(
+            self,
+            self.tr("Select Output Directory"),
+            options=_FILE_DIALOG_OPTIONS | QFileDialog.Option.ShowDirsOnly,
+        )
         if not output_dir:
             return
         try:
@@ -235,23 +270,24 @@ class EditorMainWindow(QMainWindow):
         self._status.showMessage(self.tr("Issues: {count}").format(count=len(page.issues)), 3000)
 
     def _refresh_recent_files(self) -> None:
-        for action in self._action_recent:
-            self._recent_menu.removeAction(action)
-        self._action_recent.clear()
-
-        prefs = self._settings.load()
-        for path in prefs.recent_files:
-            action = QAction(Path(path).name, self)
+        prefs = self._settings.cached_preferences()
+        recent = prefs.recent_files[: self.MAX_RECENT_FILES]
+        for action, path in zip(self._action_recent, recent):
+            name = self._recent_names.get(path)
+            if name is None:
+                name = self._recent_names[path] = Path(path).name
+            action.setText(name)
             action.setData(path)
-            action.triggered.connect(lambda checked=False, p=path: self._open_recent_file(p))
-            self._recent_menu.addAction(action)
-            self._action_recent.append(action)
+            action.setVisible(True)
+        for action in self._action_recent[len(recent):]:
+            action.setVisible(False)
+        self._action_no_recent.setVisible(not recent)
 
-        if not self._action_recent:
-            placeholder = QAction(self.tr("No recent files"), self)
-            placeholder.setEnabled(False)
-            self._recent_menu.addAction(placeholder)
-            self._action_recent.append(placeholder)
+    def _on_recent_triggered(self) -> None:
+        action = self.sender()
+        path = action.data() if isinstance(action, QAction) else None
+        if isinstance(path, str):
+            self._open_recent_file(path)
 
     def _open_recent_file(self, path: str) -> None:
         try:
@@ -262,19 +298,29 @@ class EditorMainWindow(QMainWindow):
         self._add_session(session)
 
     def _populate_profiles_menu(self, menu: QMenu) -> None:
+        profiles = self._profile_repository.discover_cached()
+        if profiles is self._shown_profiles and not menu.isEmpty():
+            return
+        self._shown_profiles = profiles
         menu.clear()
-        profiles = self._profile_repository.discover()
         if not profiles:
-            placeholder = QAction(self.tr("No profiles found"), self)
+            placeholder = QAction(self.tr("No profiles found"), menu)
             placeholder.setEnabled(False)
             menu.addAction(placeholder)
             return
         for profile in profiles:
-            action = QAction(profile.name, self)
+            # Parented to the menu so ``menu.clear()`` deletes stale actions.
+            action = QAction(profile.name, menu)
             action.setData(str(profile.path))
-            action.triggered.connect(lambda checked=False, p=profile.path: self._open_profile(p))
+            action.triggered.connect(self._on_profile_triggered)
             menu.addAction(action)
 
+    def _on_profile_triggered(self) -> None:
+        action = self.sender()
+        path = action.data() if isinstance(action, QAction) else None
+        if isinstance(path, str):
+            self._open_profile(Path(path))
+
     def _open_profile(self, path: Path) -> None:
         try:
             session = self._network.open_device(path)
@@ -340,21 +386,20 @@ class EditorMainWindow(QMainWindow):
         )
 
     def _current_page(self) -> DeviceEditorPage | None:
-        widget = self._tabs.currentWidget()
-        return widget if isinstance(widget, DeviceEditorPage) else None
+        return self._pages.get(id(self._tabs.currentWidget()), _NO_PAGE)[0]
 
     def _current_session(self) -> DeviceSession | None:
-        page = self._current_page()
-        if page is None:
-            return None
-        return self._pages.get(page)
+        return self._pages.get(id(self._tabs.currentWidget()), _NO_PAGE)[1]
 
     def _add_object_entry(self) -> None:
         session = self._current_session()
         if session is None:
             return
 
-        dialog = AddObjectDialog(self)
+        if self._add_object_dialog is None:
+            self._add_object_dialog = AddObjectDialog(self)
+        dialog = self._add_object_dialog
+        dialog.reset()
         if dialog.exec() != QDialog.DialogCode.Accepted:
             return
 
@@ -369,8 +414,8 @@ class EditorMainWindow(QMainWindow):
             QMessageBox.warning(self, self.tr("Unable to add object"), str(exc))
             return
 
-        page = self._tabs.currentWidget()
-        if isinstance(page, DeviceEditorPage):
+        page = self._current_page()
+        if page is not None:
             page.set_device(session.device)
         self._update_context_widgets()
         self._status.showMessage(
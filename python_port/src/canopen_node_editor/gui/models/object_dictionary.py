@@ -4,11 +4,32 @@ from __future__ import annotations
 
 from typing import Iterable
 
-from PySide6.QtCore import QModelIndex, Qt, Signal
-from PySide6.QtGui import QStandardItem, QStandardItemModel
+from PySide6.QtCore import QModelIndex, Qt, QTimer, Signal
+from PySide6.QtGui import QBrush, QColor, QStandardItem, QStandardItemModel
 
 from ...model import Device, ObjectEntry, SubObject
 
+# Shared by every highlighted row instead of allocating a brush per item.
+_PENDING_BRUSH = QBrush(QColor(200, 120, 0))
+_PDO_BRUSH = QBrush(QColor(33, 150, 243))
+
+# Row labels are formatted once and shared across refreshes. Sub-indices are
+# bounded by the CANopen 8-bit range; entry labels are memoised on first use
+# rather than tabulating all 65536 indices up front.
+_DEC = tuple(str(value) for value in range(256))
+_HEX4: dict[int, str] = {}
+
+
+# Model field behind each entry column after the index; None is read-only.
+_ENTRY_FIELDS = ("name", None, None, "value", "default")
+
+
+def _hex_label(index: int) -> str:
+    label = _HEX4.get(index)
+    if label is None:
+        label = _HEX4[index] = f"0x{index:04X}"
+    return label
+
 
 class ObjectDictionaryModel(QStandardItemModel):
     """Tree model presenting :class:`~canopen_node_editor.model.Device` objects."""
@@ -27,39 +48,180 @@ class ObjectDictionaryModel(QStandardItemModel):
     ) -> None:
         super().__init__(parent)
         self.setHorizontalHeaderLabels([self.tr(text) for text in self.COLUMN_HEADERS])
+        # Placeholders are translated once here rather than per row.
+        self._unnamed_object_label = self.tr("Unnamed Object")
+        self._unknown_type_label = self.tr("Unknown")
+        self._unnamed_sub_label = self.tr("SubIndex")
         self._device: Device | None = None
         self._include_subindices = include_subindices
         self._editable = editable
-
-    def set_device(self, device: Device | None) -> None:
+        # Per-entry signatures of what the rows currently show, keyed by index.
+        self._signatures: dict[int, tuple] = {}
+        # ``entry.index`` of every top-level row, in row order.
+        self._row_indexes: list[int] = []
+        self._row_by_index: dict[int, int] = {}
+        # Items carry ``(index, subindex)`` keys, -1 for the entry itself,
+        # and resolve to the shown objects through this map.
+        self._entry_by_index: dict[int, ObjectEntry] = {}
+        self._refresh_pending = False
+
+    def set_device(self, device: Device | None) -> bool:
+        """Show ``device`` and return whether any row was added or rewritten."""
+
+        if device is not self._device:
+            # Every row references the old device's objects; rebuild in bulk.
+            self._signatures.clear()
         self._device = device
-        self._refresh()
+        self._refresh_pending = False
+        return self._refresh()
 
     def device(self) -> Device | None:
         return self._device
 
     # ------------------------------------------------------------------
-    def _refresh(self) -> None:
-        self.removeRows(0, self.rowCount())
+    def _refresh(self) -> bool:
         if not self._device:
-            return
-
-        for entry in self._device.all_entries():
-            parent = self._create_entry_item(entry)
-            self.appendRow(parent)
-            if self._include_subindices and entry.sub_objects:
-                for subindex, sub in sorted(entry.sub_objects.items()):
-                    child_items = self._create_sub_item(entry, subindex, sub)
-                    parent[0].appendRow(child_items)
+            changed = self.rowCount() > 0
+            self.removeRows(0, self.rowCount())
+            self._signatures.clear()
+            self._set_row_indexes([])
+            return changed
+
+        entries = self._device.all_entries()
+        if not self._signatures:
+            self._rebuild(entries)
+            return True
+
+        changed = False
+        present = {entry.index for entry in entries}
+        for row in range(len(self._row_indexes) - 1, -1, -1):
+            index_value = self._row_indexes[row]
+            if index_value not in present:
+                self.removeRow(row)
+                self._signatures.pop(index_value, None)
+                changed = True
+
+        # Remaining rows keep their relative order because entries are sorted
+        # by index, so each entry either matches the row at ``row`` or is new.
+        for row, entry in enumerate(entries):
+            signature = self._entry_signature(entry)
+            previous = self._signatures.get(entry.index)
+            if previous is None:
+                self.insertRow(row, self._create_entry_item(entry))
+                self._append_sub_rows(self.item(row, 0), entry)
+                changed = True
+            elif previous != signature:
+                self._rewrite_row(row, entry)
+                changed = True
+            self._signatures[entry.index] = signature
+        if changed:
+            self._set_row_indexes(entries)
+        return changed
+
+    def _rebuild(self, entries: list[ObjectEntry]) -> None:
+        # Populate with signals blocked inside a reset so attached views
+        # relayout once rather than per inserted row.
+        self.beginResetModel()
+        blocked = self.blockSignals(True)
+        try:
+            self.removeRows(0, self.rowCount())
+            append_row = self.appendRow
+            create_item = self._create_entry_item
+            append_subs = self._append_sub_rows
+            signature_of = self._entry_signature
+            signatures = self._signatures
+            for entry in entries:
+                items = create_item(entry)
+                append_row(items)
+                append_subs(items[0], entry)
+                signatures[entry.index] = signature_of(entry)
+            self._set_row_indexes(entries)
+        finally:
+            self.blockSignals(blocked)
+            self.endResetModel()
+
+    def _rewrite_row(self, row: int, entry: ObjectEntry) -> None:
+        # The index cell and its key are the same for the same entry index.
+        # Cells are written through the model's setItemData, which merges
+        # roles, rather than through per-item setters.
+        texts = (
+            entry.name or self._unnamed_object_label,
+            entry.object_type.name if entry.object_type else self._unknown_type_label,
+            entry.access_type.name if entry.access_type else "",
+            entry.value or "",
+            entry.default or "",
+        )
+        for column, (text, field) in enumerate(zip(texts, _ENTRY_FIELDS), start=1):
+            roles = {Qt.DisplayRole: text}
+            if self._editable and field is not None:
+                roles[self._FIELD_ROLE] = (entry, None, field)
+            self.setItemData(self.index(row, column), roles)
+        self._update_pending_brush(self.index(row, 1), entry)
+        parent_index = self.index(row, 0)
+        self.removeRows(0, self.rowCount(parent_index), parent_index)
+        self._append_sub_rows(self.itemFromIndex(parent_index), entry)
+
+    def _set_row_indexes(self, entries: list[ObjectEntry]) -> None:
+        self._row_indexes = [entry.index for entry in entries]
+        self._row_by_index = {entry.index: row for row, entry in enumerate(entries)}
+        self._entry_by_index = {entry.index: entry for entry in entries}
+
+    def row_for_index(self, index: int) -> int | None:
+        """Return the top-level row showing the entry at ``index``, if any."""
+
+        return self._row_by_index.get(index)
+
+    def payload(self, index: QModelIndex) -> tuple[ObjectEntry, SubObject | None] | None:
+        """Return the ``(entry, sub)`` shown at a column-0 ``index``."""
+
+        key = index.data(Qt.UserRole)
+        if key is None:
+            return None
+        entry = self._entry_by_index.get(key[0])
+        if entry is None:
+            return None
+        if key[1] < 0:
+            return entry, None
+        sub = entry.sub_objects.get(key[1])
+        return (entry, sub) if sub is not None else None
+
+    def _entry_signature(self, entry: ObjectEntry) -> tuple:
+        # Identities are included because item payloads reference the objects.
+        subs = tuple(
+            (
+                subindex,
+                id(sub),
+                sub.name,
+                sub.data_type,
+                sub.access_type,
+                sub.value,
+                sub.default,
+                sub.pdo_mapping,
+            )
+            for subindex, sub in entry.sorted_sub_items()
+        ) if self._include_subindices else ()
+        return (
+            id(entry),
+            entry.name,
+            entry.object_type,
+            entry.access_type,
+            entry.value,
+            entry.default,
+            subs,
+        )
+
+    def _append_sub_rows(self, parent: QStandardItem, entry: ObjectEntry) -> None:
+        if self._include_subindices and entry.sub_objects:
+            for subindex, sub in entry.sorted_sub_items():
+                parent.appendRow(self._create_sub_item(entry, subindex, sub))
 
     def _create_entry_item(self, entry: ObjectEntry) -> list[QStandardItem]:
-        index_text = f"0x{entry.index:04X}"
-        type_name = entry.object_type.name if entry.object_type else self.tr("Unknown")
+        type_name = entry.object_type.name if entry.object_type else self._unknown_type_label
         access = entry.access_type.name if entry.access_type else ""
 
-        index_item = QStandardItem(index_text)
-        index_item.setData((entry, None), Qt.UserRole)
-        name_item = QStandardItem(entry.name or self.tr("Unnamed Object"))
+        index_item = QStandardItem(_hex_label(entry.index))
+        index_item.setData((entry.index, -1), Qt.UserRole)
+        name_item = QStandardItem(entry.name or self._unnamed_object_label)
         type_item = QStandardItem(type_name)
         access_item = QStandardItem(access)
         value_item = QStandardItem(entry.value or "")
@@ -77,7 +239,7 @@ class ObjectDictionaryModel(QStandardItemModel):
             if self._editable:
                 item.setData((entry, None, field), self._FIELD_ROLE)
 
-        if entry.value is None and entry.default is None:
+        if _is_pending(entry):
             # Highlight entries that still require configuration.
             name_item.setData(self._pending_brush(), Qt.ForegroundRole)
 
@@ -86,15 +248,15 @@ class ObjectDictionaryModel(QStandardItemModel):
     def _create_sub_item(
         self, entry: ObjectEntry, subindex: int, sub: SubObject
     ) -> list[QStandardItem]:
-        index_text = f"{subindex}"
-        name_item = QStandardItem(sub.name or self.tr("SubIndex"))
+        index_text = _DEC[subindex] if 0 <= subindex < len(_DEC) else str(subindex)
+        name_item = QStandardItem(sub.name or self._unnamed_sub_label)
         type_item = QStandardItem(sub.data_type.name)
         access_item = QStandardItem(sub.access_type.name)
         value_item = QStandardItem(sub.value or "")
         default_item = QStandardItem(sub.default or "")
 
         index_item = QStandardItem(index_text)
-        index_item.setData((entry, sub), Qt.UserRole)
+        index_item.setData((entry.index, subindex), Qt.UserRole)
 
         for item in (index_item, type_item, access_item):
             item.setEditable(False)
@@ -129,35 +291,93 @@ class ObjectDictionaryModel(QStandardItemModel):
                     text = text.strip()
                     setattr_target = sub or entry
                     setattr(setattr_target, field, text or None)
+                    # Show the stored value, as a rebuild would, so the cell
+                    # and the model agree without a refresh.
+                    shown = text
+                    if not shown and field == "name":
+                        shown = self._unnamed_sub_label if sub else self._unnamed_object_label
+                    result = super().setData(index, shown, role)
+                    if sub is None and field != "name":
+                        self._update_pending_brush(index.siblingAtColumn(1), entry)
+                    if entry.index in self._signatures:
+                        self._signatures[entry.index] = self._entry_signature(entry)
                     self.valueEdited.emit(entry, sub)
+                    return result
         return super().setData(index, value, role)
 
     # ------------------------------------------------------------------
     def refresh(self) -> None:
         """Rebuild the model preserving the currently loaded device."""
 
+        self._refresh_pending = False
         self._refresh()
 
-    def _pending_brush(self):
-        from PySide6.QtGui import QBrush, QColor
+    def update_entry(self, entry: ObjectEntry) -> bool:
+        """Rewrite the row showing ``entry`` in place.
+
+        Returns ``False`` when the entry has no row yet, in which case a
+        refresh is needed to insert it.
+        """
+
+        row = self._row_by_index.get(entry.index)
+        if row is None:
+            return False
+        signature = self._entry_signature(entry)
+        if self._signatures.get(entry.index) != signature:
+            self._rewrite_row(row, entry)
+            self._signatures[entry.index] = signature
+            self._entry_by_index[entry.index] = entry
+        return True
+
+    def schedule_refresh(self) -> None:
+        """Refresh once control returns to the event loop.
+
+        Repeated calls before then collapse into a single refresh.
+        """
+
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._do_scheduled_refresh)
+
+    def _do_scheduled_refresh(self) -> None:
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self._refresh()
+
+    def _update_pending_brush(self, name_index: QModelIndex, entry: ObjectEntry) -> None:
+        roles = self.itemData(name_index)
+        if _is_pending(entry):
+            if Qt.ForegroundRole not in roles:
+                super().setData(name_index, self._pending_brush(), Qt.ForegroundRole)
+            return
+        if roles.pop(Qt.ForegroundRole, None) is None:
+            return
+        # setItemData only merges roles, so drop the highlight by clearing the
+        # cell and restoring the rest instead of writing None into the role.
+        # Clearing also resets the flags, which the name cell takes from the
+        # model's editability.
+        self.clearItemData(name_index)
+        self.setItemData(name_index, roles)
+        if not self._editable:
+            self.itemFromIndex(name_index).setEditable(False)
+
+    def _pending_brush(self) -> QBrush:
+        return _PENDING_BRUSH
 
-        return QBrush(QColor(200, 120, 0))
+    def _pdo_brush(self) -> QBrush:
+        return _PDO_BRUSH
 
-    def _pdo_brush(self):
-        from PySide6.QtGui import QBrush, QColor
 
-        return QBrush(QColor(33, 150, 243))
+def _is_pending(entry: ObjectEntry) -> bool:
+    return entry.value is None and entry.default is None
 
 
 def iter_selected_payloads(
-    indexes: Iterable[QModelIndex], model: QStandardItemModel
+    indexes: Iterable[QModelIndex], model: ObjectDictionaryModel
 ) -> Iterable[tuple[ObjectEntry, SubObject | None]]:
     for index in indexes:
         if not index.isValid() or index.column() != 0:
             continue
-        item = model.itemFromIndex(index)
-        if item is None:
-            continue
-        data = item.data(Qt.UserRole)
-        if isinstance(data, tuple):
-            yield data
+        payload = model.payload(index)
+        if payload is not None:
+            yield payload
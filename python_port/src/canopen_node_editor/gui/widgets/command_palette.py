@@ -5,8 +5,18 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Callable, Iterable, List
 
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QDialog, QDialogButtonBox, QLineEdit, QListWidget, QListWidgetItem, QVBoxLayout
+from PySide6.QtCore import QEvent, QObject, Qt, QTimer
+from PySide6.QtWidgets import (
+    QApplication,
+    QDialog,
+    QDialogButtonBox,
+    QLineEdit,
+    QListWidget,
+    QListWidgetItem,
+    QVBoxLayout,
+)
+
+_NAVIGATION_KEYS = frozenset({Qt.Key_Up, Qt.Key_Down, Qt.Key_PageUp, Qt.Key_PageDown})
 
 
 @dataclass
@@ -19,6 +29,8 @@ class Command:
 class CommandPalette(QDialog):
     """Modal dialog providing quick command search."""
 
+    FILTER_DELAY_MS = 60
+
     def __init__(self, commands: Iterable[Command], parent=None) -> None:
         super().__init__(parent)
         self.setWindowTitle(self.tr("Command Palette"))
@@ -29,7 +41,14 @@ class CommandPalette(QDialog):
 
         self._filter = QLineEdit(self)
         self._filter.setPlaceholderText(self.tr("Search commands"))
-        self._filter.textChanged.connect(self._rebuild)
+        # Coalesce bursts of keystrokes into a single filter pass.
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(self.FILTER_DELAY_MS)
+        self._filter_timer.timeout.connect(self._rebuild)
+        self._filter.textChanged.connect(self._filter_timer.start)
+        self._filter.returnPressed.connect(self._accept_selection)
+        self._filter.installEventFilter(self)
 
         self._list = QListWidget(self)
         self._list.itemActivated.connect(self._accept_current)
@@ -42,26 +61,66 @@ class CommandPalette(QDialog):
         layout.addWidget(self._list)
         layout.addWidget(buttons)
 
+        self._populate()
         self._rebuild()
 
     def reset(self) -> None:
         self._filter.clear()
+        self._filter_timer.stop()
         self._rebuild()
 
-    def _rebuild(self) -> None:
-        query = self._filter.text().strip().lower()
+    def _populate(self) -> None:
+        # Items are created once per command set; filtering only toggles
+        # their visibility against the pre-lowered command text.
         self._list.clear()
+        self._items: List[tuple[QListWidgetItem, str]] = []
         for command in self._commands:
-            if query and query not in command.text.lower():
-                continue
             label = command.text
             if command.shortcut:
                 label = f"{label} ({command.shortcut})"
             item = QListWidgetItem(label)
             item.setData(Qt.UserRole, command)
             self._list.addItem(item)
-        if self._list.count():
-            self._list.setCurrentRow(0)
+            self._items.append((item, command.text.lower()))
+
+    def _rebuild(self) -> None:
+        query = self._filter.text().strip().lower()
+        first_visible: QListWidgetItem | None = None
+        self._list.setUpdatesEnabled(False)
+        try:
+            for item, lower in self._items:
+                hidden = bool(query) and not _matches(query, lower)
+                item.setHidden(hidden)
+                if first_visible is None and not hidden:
+                    first_visible = item
+        finally:
+            self._list.setUpdatesEnabled(True)
+        if first_visible is not None:
+            self._list.setCurrentItem(first_visible)
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # type: ignore[override]
+        # Arrow keys typed into the filter move through the visible items;
+        # the list skips hidden rows itself.
+        if (
+            watched is self._filter
+            and event.type() == QEvent.Type.KeyPress
+            and event.key() in _NAVIGATION_KEYS
+        ):
+            self._flush_filter()
+            QApplication.sendEvent(self._list, event)
+            return True
+        return super().eventFilter(watched, event)
+
+    def _flush_filter(self) -> None:
+        if self._filter_timer.isActive():
+            self._filter_timer.stop()
+            self._rebuild()
+
+    def _accept_selection(self) -> None:
+        self._flush_filter()
+        item = self._list.currentItem()
+        if item is not None and not item.isHidden():
+            self._accept_current(item)
 
     def _accept_current(self, item: QListWidgetItem) -> None:
         command = item.data(Qt.UserRole)
@@ -72,4 +131,14 @@ class CommandPalette(QDialog):
 
     def set_commands(self, commands: Iterable[Command]) -> None:
         self._commands = list(commands)
+        self._populate()
         self._rebuild()
+
+
+def _matches(query: str, text: str) -> bool:
+    """Return whether ``query`` is a substring or an in-order subsequence."""
+
+    if query in text:
+        return True
+    remaining = iter(text)
+    return all(char in remaining for char in query)
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-from PySide6.QtCore import Signal
+from PySide6.QtCore import QEvent, QPointF, QSize, Qt, QTimer, Signal
+from PySide6.QtGui import QPainter, QPalette, QStaticText, QTransform
 from PySide6.QtWidgets import (
     QHBoxLayout,
-    QLabel,
+    QSizePolicy,
     QTabWidget,
     QTextEdit,
     QVBoxLayout,
@@ -20,15 +21,63 @@ from .pdo_editor import PDOEditorWidget
 from .report_viewer import ReportViewerWidget
 
 
+class _StaticLabel(QWidget):
+    """Single-line label that paints a pre-shaped ``QStaticText``."""
+
+    def __init__(self, text: str = "", parent=None) -> None:
+        super().__init__(parent)
+        self._static = QStaticText(text)
+        self._static.setTextFormat(Qt.PlainText)
+        self._static.setPerformanceHint(QStaticText.AggressiveCaching)
+        self.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
+        self._prepare()
+
+    def text(self) -> str:
+        return self._static.text()
+
+    def setText(self, text: str) -> None:
+        if text == self._static.text():
+            return
+        self._static.setText(text)
+        self._prepare()
+        self.updateGeometry()
+        self.update()
+
+    def sizeHint(self) -> QSize:  # type: ignore[override]
+        size = self._static.size()
+        return QSize(int(size.width()) + 1, max(int(size.height()), self.fontMetrics().height()))
+
+    def minimumSizeHint(self) -> QSize:  # type: ignore[override]
+        return QSize(0, self.sizeHint().height())
+
+    def changeEvent(self, event: QEvent) -> None:  # type: ignore[override]
+        if event.type() == QEvent.Type.FontChange:
+            self._prepare()
+            self.updateGeometry()
+        super().changeEvent(event)
+
+    def paintEvent(self, _event) -> None:  # type: ignore[override]
+        painter = QPainter(self)
+        painter.setPen(self.palette().color(QPalette.ColorRole.WindowText))
+        painter.drawStaticText(QPointF(0, 0), self._static)
+
+    def _prepare(self) -> None:
+        self._static.prepare(QTransform(), self.font())
+
+
 class DeviceEditorPage(QWidget):
     """Tabbed workspace hosting the editors for a device session."""
 
     addEntryRequested = Signal()
+    issuesChanged = Signal()
 
     def __init__(self, device: Device, parent=None) -> None:
         super().__init__(parent)
         self.device = device
         self.issues: list[ValidationIssue] = []
+        self._edit_refresh_pending = False
+        self._last_summary_html = ""
+        self._retranslate()
 
         layout = QVBoxLayout(self)
 
@@ -51,23 +100,17 @@ class DeviceEditorPage(QWidget):
 
         self._tabs.addTab(self._object_page, self.tr("Object Dictionary"))
 
-        self.pdo_editor = PDOEditorWidget(self)
-        self._tabs.addTab(self.pdo_editor, self.tr("PDO Editor"))
-
-        self._overview_page = QWidget(self)
-        overview_layout = QVBoxLayout(self._overview_page)
-        overview_layout.setContentsMargins(0, 0, 0, 0)
-        self._title = QLabel("", self._overview_page)
-        self._title.setObjectName("devicePageTitle")
-        self._summary = QTextEdit(self._overview_page)
-        self._summary.setReadOnly(True)
-        self._summary.setObjectName("deviceSummary")
-        overview_layout.addWidget(self._title)
-        overview_layout.addWidget(self._summary)
-        self._tabs.addTab(self._overview_page, self.tr("Overview"))
-
-        self.report_view = ReportViewerWidget(self)
-        self._tabs.addTab(self.report_view, self.tr("Validation Report"))
+        # The remaining tabs start as empty pages and build their contents
+        # the first time they are shown or accessed.
+        self._pdo_editor: PDOEditorWidget | None = None
+        self._pdo_editor_stale = False
+        self._title: _StaticLabel | None = None
+        self._summary: QTextEdit | None = None
+        self._report_view: ReportViewerWidget | None = None
+        self._pdo_page = self._add_lazy_tab(self.tr("PDO Editor"))
+        self._overview_page = self._add_lazy_tab(self.tr("Overview"))
+        self._report_page = self._add_lazy_tab(self.tr("Validation Report"))
+        self._tabs.currentChanged.connect(self._materialize_tab)
 
         self.object_dictionary.selectionChanged.connect(self._on_selection_changed)
         self.object_dictionary.addEntryRequested.connect(self.addEntryRequested.emit)
@@ -82,6 +125,7 @@ class DeviceEditorPage(QWidget):
         self.refresh()
 
     def refresh(self) -> None:
+        self._edit_refresh_pending = False
         self.issues = validate_device(self.device)
         current_entry = self.object_editor.current_entry()
         self.object_dictionary.set_device(self.device)
@@ -93,10 +137,76 @@ class DeviceEditorPage(QWidget):
                 self.object_dictionary.select_first_row()
             else:
                 self.object_editor.set_entry(None)
-        self.pdo_editor.set_device(self.device)
-        self.report_view.set_report(self.device, self.issues)
-        self._summary.setHtml(self._build_summary())
-        self._title.setText(self._format_title())
+        self._sync_pdo_editor()
+        if self._report_view is not None:
+            self._report_view.set_report(self.device, self.issues)
+        self._update_overview()
+
+    # ------------------------------------------------------------------
+    @property
+    def pdo_editor(self) -> PDOEditorWidget:
+        return self._ensure_pdo_editor()
+
+    @property
+    def report_view(self) -> ReportViewerWidget:
+        return self._ensure_report_view()
+
+    def _ensure_pdo_editor(self) -> PDOEditorWidget:
+        if self._pdo_editor is None:
+            self._pdo_editor = PDOEditorWidget(self._pdo_page)
+            self._pdo_page.layout().addWidget(self._pdo_editor)
+            self._pdo_editor.set_device(self.device)
+        elif self._pdo_editor_stale:
+            self._pdo_editor_stale = False
+            self._pdo_editor.set_device(self.device)
+        return self._pdo_editor
+
+    def _sync_pdo_editor(self) -> None:
+        # A hidden PDO editor is only marked stale; it catches up when its
+        # tab is shown or the editor is accessed.
+        if self._pdo_editor is None:
+            return
+        if self._tabs.currentWidget() is self._pdo_page:
+            self._pdo_editor_stale = False
+            self._pdo_editor.set_device(self.device)
+        else:
+            self._pdo_editor_stale = True
+
+    def _ensure_report_view(self) -> ReportViewerWidget:
+        if self._report_view is None:
+            self._report_view = ReportViewerWidget(self._report_page)
+            self._report_page.layout().addWidget(self._report_view)
+            self._report_view.set_report(self.device, self.issues)
+        return self._report_view
+
+    def _ensure_overview(self) -> None:
+        if self._summary is not None:
+            return
+        self._title = _StaticLabel("", self._overview_page)
+        self._title.setObjectName("devicePageTitle")
+        self._summary = QTextEdit(self._overview_page)
+        self._summary.setReadOnly(True)
+        self._summary.setObjectName("deviceSummary")
+        layout = self._overview_page.layout()
+        layout.addWidget(self._title)
+        layout.addWidget(self._summary)
+        self._update_overview()
+
+    def _add_lazy_tab(self, label: str) -> QWidget:
+        page = QWidget(self)
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._tabs.addTab(page, label)
+        return page
+
+    def _materialize_tab(self, index: int) -> None:
+        page = self._tabs.widget(index)
+        if page is self._pdo_page:
+            self._ensure_pdo_editor()
+        elif page is self._overview_page:
+            self._ensure_overview()
+        elif page is self._report_page:
+            self._ensure_report_view()
 
     # ------------------------------------------------------------------
     def _on_selection_changed(
@@ -105,16 +215,36 @@ class DeviceEditorPage(QWidget):
         self.object_editor.set_entry(entry)
 
     def _on_entry_changed(self, entry: ObjectEntry) -> None:
-        self.object_dictionary.refresh(entry)
-        self.pdo_editor.set_device(self.device)
+        # Only the edited entry's row can change; rewrite it in place.
+        self.object_dictionary.update_entry(entry)
+        self._schedule_edit_refresh()
 
     def _on_sub_entry_changed(self, _entry: ObjectEntry, _sub: SubObject) -> None:
-        self.pdo_editor.set_device(self.device)
+        self._schedule_edit_refresh()
+
+    def _schedule_edit_refresh(self) -> None:
+        # Value edits leave the dictionary structure alone, so only the PDO
+        # tables and validation-derived views need updating, once per
+        # event-loop tick however many edits arrived.
+        if not self._edit_refresh_pending:
+            self._edit_refresh_pending = True
+            QTimer.singleShot(0, self._apply_edit_refresh)
+
+    def _apply_edit_refresh(self) -> None:
+        if not self._edit_refresh_pending:
+            return
+        self._edit_refresh_pending = False
+        self._sync_pdo_editor()
+        previous = self.issues
+        self.issues = validate_device(self.device)
+        if self._report_view is not None:
+            self._report_view.set_report(self.device, self.issues)
+        self._update_overview()
+        if self.issues != previous:
+            self.issuesChanged.emit()
 
     def show_validation_report(self) -> None:
-        index = self._tabs.indexOf(self.report_view)
-        if index >= 0:
-            self._tabs.setCurrentIndex(index)
+        self._tabs.setCurrentWidget(self._report_page)
 
     # ------------------------------------------------------------------
     def _format_title(self) -> str:
@@ -123,24 +253,62 @@ class DeviceEditorPage(QWidget):
         vendor = info.vendor_name or self.tr("Unknown Vendor")
         return self.tr("{name} – {vendor}").format(name=name, vendor=vendor)
 
+    def _retranslate(self) -> None:
+        # Summary labels are translated once per language rather than on
+        # every refresh, and baked into a template with only the per-device
+        # fields left open.
+        vendor, product, revision, heading = (
+            _escape_braces(self.tr(text))
+            for text in ("Vendor", "Product", "Revision", "Validation Issues")
+        )
+        self._summary_template = (
+            f"<ul>\n"
+            f"<li><strong>{vendor}:</strong> {{vendor}}\n"
+            f"<li><strong>{product}:</strong> {{product}}\n"
+            f"<li><strong>{revision}:</strong> {{revision}}\n"
+            f"</ul>\n"
+            f"<h3>{heading}</h3>\n"
+            f"{{body}}"
+        )
+        self._no_issues_body = f"<p>{self.tr('No validation issues detected.')}</p>"
+
+    def changeEvent(self, event: QEvent) -> None:  # type: ignore[override]
+        if event.type() == QEvent.Type.LanguageChange:
+            self._retranslate()
+            self._update_overview()
+        super().changeEvent(event)
+
+    def _update_overview(self) -> None:
+        if self._summary is None or self._title is None:
+            return
+        # setHtml re-parses and re-lays out the whole document; skip it when
+        # the rendered summary is unchanged.
+        html = self._build_summary()
+        if html != self._last_summary_html:
+            self._last_summary_html = html
+            self._summary.setHtml(html)
+        title = self._format_title()
+        if title != self._title.text():
+            self._title.setText(title)
+
     def _build_summary(self) -> str:
         info = self.device.info
-        lines = ["<ul>"]
-        lines.append(f"<li><strong>{self.tr('Vendor')}:</strong> {info.vendor_name or '-'}")
-        lines.append(f"<li><strong>{self.tr('Product')}:</strong> {info.product_name or '-'}")
-        lines.append(f"<li><strong>{self.tr('Revision')}:</strong> {info.revision_number or '-'}")
-        lines.append("</ul>")
-        lines.append("<h3>" + self.tr("Validation Issues") + "</h3>")
-        if not self.issues:
-            lines.append("<p>" + self.tr("No validation issues detected.") + "</p>")
+        if self.issues:
+            items = "\n".join(
+                f"<li><strong>{issue.severity.title()}</strong>: {issue.message}</li>"
+                for issue in self.issues
+            )
+            body = f"<ul>\n{items}\n</ul>"
         else:
-            lines.append("<ul>")
-            for issue in self.issues:
-                lines.append(
-                    "<li><strong>{severity}</strong>: {message}</li>".format(
-                        severity=issue.severity.title(),
-                        message=issue.message,
-                    )
-                )
-            lines.append("</ul>")
-        return "\n".join(lines)
+            body = self._no_issues_body
+        return self._summary_template.format(
+            vendor=info.vendor_name or "-",
+            product=info.product_name or "-",
+            revision=info.revision_number or "-",
+            body=body,
+        )
+
+
+def _escape_braces(text: str) -> str:
+    return text.replace("{", "{{").replace("}", "}}")
+
@@ -11,7 +11,7 @@ from PySide6.QtWidgets import (
     QVBoxLayout,
 )
 
-from ...model import Device, ObjectEntry
+from ...model import Device, ObjectEntry, SubObject
 from ..models.object_dictionary import ObjectDictionaryModel, iter_selected_payloads
 
 
@@ -36,6 +36,8 @@ class ObjectDictionaryWidget(QWidget):
             editable=editable,
         )
         self._include_subindices = include_subindices
+        # The (entry, sub) pair last announced through selectionChanged.
+        self._last_emitted: tuple[ObjectEntry, SubObject | None] | None = None
         self._add_button = QPushButton(self.tr("Add Object"), self)
         self._add_button.clicked.connect(self.addEntryRequested.emit)
         self._add_button.setVisible(show_add_button)
@@ -44,10 +46,11 @@ class ObjectDictionaryWidget(QWidget):
         self._tree.setModel(self._model)
         self._tree.setUniformRowHeights(True)
         self._tree.setAlternatingRowColors(True)
+        self._tree.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        self._tree.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self._tree.setRootIsDecorated(include_subindices)
         if not editable:
             self._tree.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
-        self._tree.expandAll()
         self._tree.selectionModel().selectionChanged.connect(self._on_selection_changed)
         if editable:
             self._model.valueEdited.connect(self._on_value_edited)
@@ -59,11 +62,38 @@ class ObjectDictionaryWidget(QWidget):
 
     # ------------------------------------------------------------------
     def set_device(self, device: Device | None) -> None:
-        self._model.set_device(device)
+        changed = self._model.set_device(device)
         self._add_button.setEnabled(device is not None)
-        self._tree.expandToDepth(0)
-        if device:
-            self._tree.resizeColumnToContents(0)
+        if not changed:
+            # Same device with no row edits: the tree layout is already current.
+            return
+        self._last_emitted = None
+        self._tree.setUpdatesEnabled(False)
+        try:
+            self._expand_entries()
+            if device:
+                self._tree.setColumnWidth(0, self._index_column_width())
+        finally:
+            self._tree.setUpdatesEnabled(True)
+
+    def _expand_entries(self) -> None:
+        # Without sub-index rows the tree is a flat list with nothing to
+        # expand, so skip the traversal.
+        if self._include_subindices:
+            self._tree.expandToDepth(0)
+
+    def _index_column_width(self) -> int:
+        # Index labels are always "0xHHHH", so measure the widest possible
+        # label once instead of letting the view measure every row.
+        metrics = self._tree.fontMetrics()
+        header = self._model.headerData(0, Qt.Horizontal) or ""
+        width = max(
+            metrics.horizontalAdvance("0xFFFF  "),
+            self._tree.header().fontMetrics().horizontalAdvance(f"{header}    "),
+        )
+        if self._tree.rootIsDecorated():
+            width += self._tree.indentation()
+        return width
 
     def model(self) -> ObjectDictionaryModel:
         return self._model
@@ -77,28 +107,52 @@ class ObjectDictionaryWidget(QWidget):
     def refresh(self, entry: ObjectEntry | None = None) -> None:
         current_index = entry.index if entry else self._selected_entry_index()
         self._model.refresh()
-        self._tree.expandToDepth(0)
+        self._expand_entries()
         if current_index is not None:
             self._select_entry_by_index(current_index)
 
+    def update_entry(self, entry: ObjectEntry) -> None:
+        """Redraw the row for ``entry`` only, refreshing if it is not shown."""
+
+        if not self._model.update_entry(entry):
+            self._model.schedule_refresh()
+
+    def schedule_refresh(self) -> None:
+        """Coalesce refresh requests into one pass on the next event-loop tick."""
+
+        self._model.schedule_refresh()
+
     # ------------------------------------------------------------------
     def _on_selection_changed(self, selected, _deselected) -> None:
-        indexes = selected.indexes()
-        for entry, sub in iter_selected_payloads(indexes, self._model):
-            self.selectionChanged.emit(entry, sub)
+        # Single row selection: the first range identifies the row, and only
+        # its column 0 carries the payload.
+        if selected.isEmpty():
+            return
+        first = selected.first()
+        payload = self._model.payload(self._model.index(first.top(), 0, first.parent()))
+        if payload is None:
+            return
+        last = self._last_emitted
+        if last is not None and last[0] is payload[0] and last[1] is payload[1]:
+            # Re-selecting the announced pair; listeners are already current.
+            return
+        self._emit_selection(*payload)
 
     def _on_value_edited(self, entry, sub) -> None:
         selection_model = self._tree.selectionModel()
         if selection_model is None:
             return
-        selected = list(
-            iter_selected_payloads(selection_model.selectedIndexes(), self._model)
-        )
-        for current_entry, current_sub in selected:
+        for current_entry, current_sub in iter_selected_payloads(
+            selection_model.selectedRows(0), self._model
+        ):
             if current_entry is entry and current_sub is sub:
-                self.selectionChanged.emit(entry, sub)
+                self._emit_selection(entry, sub)
                 break
 
+    def _emit_selection(self, entry: ObjectEntry, sub: SubObject | None) -> None:
+        self._last_emitted = (entry, sub)
+        self.selectionChanged.emit(entry, sub)
+
     def select_first_row(self) -> None:
         if self._model.rowCount() == 0:
             return
@@ -114,22 +168,25 @@ class ObjectDictionaryWidget(QWidget):
         if selection_model is None:
             return None
         for entry, _ in iter_selected_payloads(
-            selection_model.selectedIndexes(), self._model
+            selection_model.selectedRows(0), self._model
         ):
             return entry.index
         return None
 
     def _select_entry_by_index(self, index_value: int) -> None:
-        for row in range(self._model.rowCount()):
-            item = self._model.item(row, 0)
-            if item is None:
-                continue
-            data = item.data(Qt.UserRole)
-            if not isinstance(data, tuple):
-                continue
-            entry, _ = data
-            if isinstance(entry, ObjectEntry) and entry.index == index_value:
-                index = self._model.index(row, 0)
-                if index.isValid():
-                    self._tree.setCurrentIndex(index)
-                break
+        row = self._model.row_for_index(index_value)
+        if row is None:
+            return
+        index = self._model.index(row, 0)
+        if not index.isValid():
+            return
+        selection_model = self._tree.selectionModel()
+        if (
+            index == self._tree.currentIndex()
+            and selection_model is not None
+            and selection_model.isSelected(index)
+        ):
+            # Re-selecting the current row would still clear and rebuild the
+            # selection and repaint the view.
+            return
+        self._tree.setCurrentIndex(index)
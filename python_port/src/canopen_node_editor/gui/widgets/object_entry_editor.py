@@ -2,9 +2,9 @@
 
 from __future__ import annotations
 
-from functools import partial
+from functools import lru_cache
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import QSignalBlocker, Qt, QTimer, Signal
 from PySide6.QtWidgets import (
     QComboBox,
     QFormLayout,
@@ -29,12 +29,31 @@ class ObjectEntryEditorWidget(QWidget):
     entryChanged = Signal(ObjectEntry)
     subEntryChanged = Signal(ObjectEntry, SubObject)
 
+    #: Quiet period after the last keystroke before text edits are announced.
+    EDIT_EMIT_DELAY_MS = 150
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._entry: ObjectEntry | None = None
         self._current_sub: SubObject | None = None
         self._updating_entry = False
         self._updating_sub = False
+        # Text edits update the model immediately but are announced once
+        # typing pauses, so listeners do not run per keystroke.
+        self._pending_entry: ObjectEntry | None = None
+        self._pending_sub: tuple[ObjectEntry, SubObject] | None = None
+        # id() of each listed sub-object -> its row in the sub-index list.
+        self._sub_row_of: dict[int, int] = {}
+        # Sub-object shown on each list row, kept Python-side instead of
+        # round-tripping through item data.
+        self._row_subs: list[SubObject] = []
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(self.EDIT_EMIT_DELAY_MS)
+        self._emit_timer.timeout.connect(self._flush_pending_edits)
+        # List labels are formatted per row; translate their parts once.
+        self._sub_label_template = self.tr("{index:02X} – {name}")
+        self._unnamed_sub_label = self.tr("SubIndex")
 
         self._entry_group = QGroupBox(self.tr("Object Entry"), self)
         entry_form = QFormLayout(self._entry_group)
@@ -48,6 +67,17 @@ class ObjectEntryEditorWidget(QWidget):
         self._entry_minimum = QLineEdit(self._entry_group)
         self._entry_maximum = QLineEdit(self._entry_group)
         self._entry_pdo = QComboBox(self._entry_group)
+        self._entry_fields = (
+            self._entry_name,
+            self._entry_object_type,
+            self._entry_data_type,
+            self._entry_access,
+            self._entry_default,
+            self._entry_value,
+            self._entry_minimum,
+            self._entry_maximum,
+            self._entry_pdo,
+        )
 
         entry_form.addRow(self.tr("Name"), self._entry_name)
         entry_form.addRow(self.tr("Object Type"), self._entry_object_type)
@@ -64,6 +94,9 @@ class ObjectEntryEditorWidget(QWidget):
 
         self._sub_list = QListWidget(self._sub_group)
         self._sub_list.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
+        # Every row is a single line of text, so let the view lay out rows
+        # from one size instead of measuring each item.
+        self._sub_list.setUniformItemSizes(True)
         sub_layout.addWidget(self._sub_list)
 
         self._sub_form_container = QWidget(self._sub_group)
@@ -94,6 +127,8 @@ class ObjectEntryEditorWidget(QWidget):
         layout.addWidget(self._entry_group)
         layout.addWidget(self._sub_group)
 
+        # Item index of each value in the enum combos, in place of findData.
+        self._combo_indexes: dict[QComboBox, dict[object, int]] = {}
         self._populate_enum_combo(self._entry_object_type, ObjectType, allow_none=True)
         self._populate_enum_combo(self._entry_data_type, DataType, allow_none=True)
         self._populate_enum_combo(self._entry_access, AccessType, allow_none=True)
@@ -103,6 +138,9 @@ class ObjectEntryEditorWidget(QWidget):
         self._populate_enum_combo(self._sub_access, AccessType, allow_none=False)
         self._populate_enum_combo(self._sub_pdo, PDOMapping, allow_none=True)
 
+        # Model attribute edited by each form widget; handlers look it up via sender().
+        self._field_by_widget: dict[QWidget, str] = {}
+        self._sub_signature: tuple | None = None
         self._bind_entry_signals()
         self._bind_sub_signals()
         self._set_entry_enabled(False)
@@ -110,15 +148,29 @@ class ObjectEntryEditorWidget(QWidget):
 
     # ------------------------------------------------------------------
     def set_entry(self, entry: ObjectEntry | None) -> None:
+        self._flush_pending_edits()
+        same_entry = entry is not None and entry is self._entry
         self._entry = entry
+        # One guard covers every field write below; the edit slots check it,
+        # and the finally clause keeps it from leaking if loading fails.
         self._updating_entry = True
+        try:
+            self._load_entry(entry, same_entry=same_entry)
+        finally:
+            self._updating_entry = False
 
+    def _load_entry(self, entry: ObjectEntry | None, *, same_entry: bool = False) -> None:
         if entry is None:
+            self._sub_signature = None
             self._clear_entry_fields()
             self._set_entry_enabled(False)
-            self._sub_list.clear()
+            # Clearing would emit currentItemChanged and load "no sub-object"
+            # a second time; load it once explicitly instead.
+            with QSignalBlocker(self._sub_list):
+                self._sub_list.clear()
+            self._sub_row_of.clear()
+            self._row_subs = []
             self._load_sub_object(None)
-            self._updating_entry = False
             return
 
         self._set_entry_enabled(True)
@@ -132,111 +184,124 @@ class ObjectEntryEditorWidget(QWidget):
         self._entry_maximum.setText(entry.maximum or "")
         self._set_combo_value(self._entry_pdo, entry.pdo_mapping)
 
-        self._sub_list.blockSignals(True)
-        self._sub_list.clear()
-        for subindex, sub in sorted(entry.sub_objects.items()):
-            label = self.tr("{index:02X} – {name}").format(
-                index=subindex,
-                name=sub.name or self.tr("SubIndex"),
-            )
-            item = QListWidgetItem(label)
-            item.setData(Qt.UserRole, sub)
-            self._sub_list.addItem(item)
-        self._sub_list.blockSignals(False)
-
-        if self._sub_list.count() > 0:
+        signature = _sub_signature(entry)
+        if same_entry and signature == self._sub_signature:
+            # Re-selecting the shown entry: keep the list and its selection
+            # and only refresh the sub-index form.
+            self._load_sub_object(self._current_sub)
+            return
+        self._sub_signature = signature
+        self._fill_sub_list(entry)
+        if self._sub_list.count() == 0:
+            self._load_sub_object(None)
+        elif self._sub_list.currentRow() != 0:
             self._sub_list.setCurrentRow(0)
         else:
-            self._load_sub_object(None)
-
-        self._updating_entry = False
+            # Row 0 was kept from the previous entry, so no change signal
+            # fires; load the new sub-object directly.
+            self._load_sub_object(self._row_subs[0])
+
+    def _fill_sub_list(self, entry: ObjectEntry) -> None:
+        # Reuse the existing rows and only add or drop the difference instead
+        # of clearing the list and recreating every item per selection.
+        sub_list = self._sub_list
+        subs = entry.sorted_sub_items()
+        self._sub_row_of = {id(sub): row for row, (_, sub) in enumerate(subs)}
+        self._row_subs = [sub for _, sub in subs]
+        sub_list.blockSignals(True)
+        for row in range(sub_list.count() - 1, len(subs) - 1, -1):
+            sub_list.takeItem(row)
+        # Bound methods are looked up once, not once per row.
+        sub_label = self._sub_label
+        item_at = sub_list.item
+        for row, (subindex, sub) in enumerate(subs):
+            label = sub_label(subindex, sub)
+            item = item_at(row)
+            if item is None:
+                item = QListWidgetItem(label)
+                sub_list.addItem(item)
+            elif item.text() != label:
+                item.setText(label)
+        sub_list.blockSignals(False)
 
     # ------------------------------------------------------------------
     def _bind_entry_signals(self) -> None:
         self._entry_name.textEdited.connect(self._on_entry_name_changed)
-        self._entry_object_type.currentIndexChanged.connect(
-            partial(self._on_entry_combo_changed, self._entry_object_type, "object_type")
-        )
-        self._entry_data_type.currentIndexChanged.connect(
-            partial(self._on_entry_combo_changed, self._entry_data_type, "data_type")
-        )
-        self._entry_access.currentIndexChanged.connect(
-            partial(self._on_entry_combo_changed, self._entry_access, "access_type")
-        )
-        self._entry_default.textEdited.connect(
-            partial(self._on_entry_text_changed, "default", self._entry_default)
-        )
-        self._entry_value.textEdited.connect(
-            partial(self._on_entry_text_changed, "value", self._entry_value)
-        )
-        self._entry_minimum.textEdited.connect(
-            partial(self._on_entry_text_changed, "minimum", self._entry_minimum)
-        )
-        self._entry_maximum.textEdited.connect(
-            partial(self._on_entry_text_changed, "maximum", self._entry_maximum)
-        )
-        self._entry_pdo.currentIndexChanged.connect(
-            partial(self._on_entry_combo_changed, self._entry_pdo, "pdo_mapping")
-        )
+        for combo, field in (
+            (self._entry_object_type, "object_type"),
+            (self._entry_data_type, "data_type"),
+            (self._entry_access, "access_type"),
+            (self._entry_pdo, "pdo_mapping"),
+        ):
+            self._field_by_widget[combo] = field
+            combo.currentIndexChanged.connect(self._on_entry_combo_changed)
+        for widget, field in (
+            (self._entry_default, "default"),
+            (self._entry_value, "value"),
+            (self._entry_minimum, "minimum"),
+            (self._entry_maximum, "maximum"),
+        ):
+            self._field_by_widget[widget] = field
+            widget.textEdited.connect(self._on_entry_text_changed)
 
     def _bind_sub_signals(self) -> None:
-        self._sub_list.currentItemChanged.connect(self._on_sub_selection_changed)
+        self._sub_list.currentRowChanged.connect(self._on_sub_selection_changed)
         self._sub_name.textEdited.connect(self._on_sub_name_changed)
-        self._sub_data_type.currentIndexChanged.connect(
-            partial(self._on_sub_combo_changed, self._sub_data_type, "data_type")
-        )
-        self._sub_access.currentIndexChanged.connect(
-            partial(self._on_sub_combo_changed, self._sub_access, "access_type")
-        )
-        self._sub_default.textEdited.connect(
-            partial(self._on_sub_text_changed, "default", self._sub_default)
-        )
-        self._sub_value.textEdited.connect(
-            partial(self._on_sub_text_changed, "value", self._sub_value)
-        )
-        self._sub_minimum.textEdited.connect(
-            partial(self._on_sub_text_changed, "minimum", self._sub_minimum)
-        )
-        self._sub_maximum.textEdited.connect(
-            partial(self._on_sub_text_changed, "maximum", self._sub_maximum)
-        )
-        self._sub_pdo.currentIndexChanged.connect(
-            partial(self._on_sub_combo_changed, self._sub_pdo, "pdo_mapping")
-        )
+        for combo, field in (
+            (self._sub_data_type, "data_type"),
+            (self._sub_access, "access_type"),
+            (self._sub_pdo, "pdo_mapping"),
+        ):
+            self._field_by_widget[combo] = field
+            combo.currentIndexChanged.connect(self._on_sub_combo_changed)
+        for widget, field in (
+            (self._sub_default, "default"),
+            (self._sub_value, "value"),
+            (self._sub_minimum, "minimum"),
+            (self._sub_maximum, "maximum"),
+        ):
+            self._field_by_widget[widget] = field
+            widget.textEdited.connect(self._on_sub_text_changed)
 
     # ------------------------------------------------------------------
     def _on_entry_name_changed(self, text: str) -> None:
         if self._entry is None or self._updating_entry:
             return
         self._entry.name = text.strip() or None
-        self.entryChanged.emit(self._entry)
+        self._schedule_entry_emit()
 
-    def _on_entry_text_changed(self, field: str, widget: QLineEdit) -> None:
+    def _on_entry_text_changed(self, text: str) -> None:
         if self._entry is None or self._updating_entry:
             return
-        value = widget.text().strip() or None
-        setattr(self._entry, field, value)
-        self.entryChanged.emit(self._entry)
+        setattr(self._entry, self._field_by_widget[self.sender()], text.strip() or None)
+        self._schedule_entry_emit()
 
-    def _on_entry_combo_changed(self, combo: QComboBox, field: str) -> None:
+    def _on_entry_combo_changed(self, _index: int) -> None:
         if self._entry is None or self._updating_entry:
             return
-        value = combo.currentData(Qt.UserRole)
-        setattr(self._entry, field, value)
+        combo = self.sender()
+        setattr(self._entry, self._field_by_widget[combo], combo.currentData(Qt.UserRole))
         self.entryChanged.emit(self._entry)
 
     # ------------------------------------------------------------------
-    def _on_sub_selection_changed(
-        self, current: QListWidgetItem | None, _previous: QListWidgetItem | None
-    ) -> None:
-        sub = current.data(Qt.UserRole) if current is not None else None
-        if not isinstance(sub, SubObject):
-            sub = None
-        self._load_sub_object(sub)
+    def _on_sub_selection_changed(self, row: int) -> None:
+        subs = self._row_subs
+        self._load_sub_object(subs[row] if 0 <= row < len(subs) else None)
 
     def _load_sub_object(self, sub: SubObject | None) -> None:
+        if sub is None and self._current_sub is None:
+            # The sub-index form is already cleared and disabled.
+            return
+        if self._pending_sub is not None:
+            self._flush_pending_edits()
         self._current_sub = sub
         self._updating_sub = True
+        try:
+            self._load_sub_fields(sub)
+        finally:
+            self._updating_sub = False
+
+    def _load_sub_fields(self, sub: SubObject | None) -> None:
         if sub is None:
             self._sub_index_label.setText("-")
             self._sub_name.clear()
@@ -248,7 +313,6 @@ class ObjectEntryEditorWidget(QWidget):
             self._sub_maximum.clear()
             self._set_combo_value(self._sub_pdo, None)
             self._set_sub_enabled(False)
-            self._updating_sub = False
             return
 
         self._set_sub_enabled(True)
@@ -261,80 +325,78 @@ class ObjectEntryEditorWidget(QWidget):
         self._sub_minimum.setText(sub.minimum or "")
         self._sub_maximum.setText(sub.maximum or "")
         self._set_combo_value(self._sub_pdo, sub.pdo_mapping)
-        self._updating_sub = False
 
     def _on_sub_name_changed(self, text: str) -> None:
         if self._entry is None or self._current_sub is None or self._updating_sub:
             return
         self._current_sub.name = text.strip() or None
-        self.subEntryChanged.emit(self._entry, self._current_sub)
-        self._refresh_sub_label(self._current_sub)
+        self._schedule_sub_emit()
 
-    def _on_sub_text_changed(self, field: str, widget: QLineEdit) -> None:
+    def _on_sub_text_changed(self, text: str) -> None:
         if self._entry is None or self._current_sub is None or self._updating_sub:
             return
-        value = widget.text().strip() or None
-        setattr(self._current_sub, field, value)
-        self.subEntryChanged.emit(self._entry, self._current_sub)
+        setattr(self._current_sub, self._field_by_widget[self.sender()], text.strip() or None)
+        self._schedule_sub_emit()
 
-    def _on_sub_combo_changed(self, combo: QComboBox, field: str) -> None:
+    def _on_sub_combo_changed(self, _index: int) -> None:
         if self._entry is None or self._current_sub is None or self._updating_sub:
             return
-        value = combo.currentData(Qt.UserRole)
-        setattr(self._current_sub, field, value)
+        combo = self.sender()
+        setattr(self._current_sub, self._field_by_widget[combo], combo.currentData(Qt.UserRole))
         self.subEntryChanged.emit(self._entry, self._current_sub)
 
+    def _schedule_entry_emit(self) -> None:
+        self._pending_entry = self._entry
+        self._emit_timer.start()
+
+    def _schedule_sub_emit(self) -> None:
+        if self._entry is not None and self._current_sub is not None:
+            self._pending_sub = (self._entry, self._current_sub)
+            self._emit_timer.start()
+
+    def _flush_pending_edits(self) -> None:
+        self._emit_timer.stop()
+        entry, self._pending_entry = self._pending_entry, None
+        pending_sub, self._pending_sub = self._pending_sub, None
+        if entry is not None:
+            self.entryChanged.emit(entry)
+        if pending_sub is not None:
+            owner, sub = pending_sub
+            self.subEntryChanged.emit(owner, sub)
+            self._refresh_sub_label(sub)
+
     # ------------------------------------------------------------------
     def _populate_enum_combo(self, combo: QComboBox, enum_cls, *, allow_none: bool) -> None:
         combo.clear()
+        indexes: dict[object, int] = {}
         if allow_none:
+            indexes[None] = combo.count()
             combo.addItem(self.tr("Not set"), None)
-        for member in enum_cls:
-            combo.addItem(self._format_enum(member), member)
+        for label, member in _enum_labels(enum_cls):
+            indexes[member] = combo.count()
+            combo.addItem(label, member)
+        self._combo_indexes[combo] = indexes
 
     def _set_combo_value(self, combo: QComboBox, value) -> None:
-        index = combo.findData(value, Qt.UserRole)
-        if index < 0 and value is None:
-            index = combo.findData(None, Qt.UserRole)
-        if index >= 0:
-            combo.blockSignals(True)
-            combo.setCurrentIndex(index)
-            combo.blockSignals(False)
-        else:
-            combo.blockSignals(True)
-            combo.setCurrentIndex(0 if combo.count() else -1)
-            combo.blockSignals(False)
+        index = self._combo_indexes[combo].get(value, -1)
+        if index < 0:
+            index = 0 if combo.count() else -1
+        if index != combo.currentIndex():
+            with QSignalBlocker(combo):
+                combo.setCurrentIndex(index)
 
     def _refresh_sub_label(self, sub: SubObject) -> None:
-        for row in range(self._sub_list.count()):
-            item = self._sub_list.item(row)
-            if item is None:
-                continue
-            stored = item.data(Qt.UserRole)
-            if stored is sub:
-                label = self.tr("{index:02X} – {name}").format(
-                    index=sub.key.subindex,
-                    name=sub.name or self.tr("SubIndex"),
-                )
-                item.setText(label)
-                break
+        row = self._sub_row_of.get(id(sub))
+        if row is not None and self._row_subs[row] is sub:
+            self._sub_list.item(row).setText(self._sub_label(sub.key.subindex, sub))
 
-    def _format_enum(self, member) -> str:
-        name = member.name.replace("_", " ").title()
-        return name
+    def _sub_label(self, subindex: int, sub: SubObject) -> str:
+        return self._sub_label_template.format(
+            index=subindex, name=sub.name or self._unnamed_sub_label
+        )
 
     def _set_entry_enabled(self, enabled: bool) -> None:
-        for widget in (
-            self._entry_name,
-            self._entry_object_type,
-            self._entry_data_type,
-            self._entry_access,
-            self._entry_default,
-            self._entry_value,
-            self._entry_minimum,
-            self._entry_maximum,
-            self._entry_pdo,
-        ):
+        for widget in self._entry_fields:
             widget.setEnabled(enabled)
 
     def _set_sub_enabled(self, enabled: bool) -> None:
@@ -356,3 +418,13 @@ class ObjectEntryEditorWidget(QWidget):
 
     def current_subobject(self) -> SubObject | None:
         return self._current_sub
+
+
+@lru_cache(maxsize=None)
+def _enum_labels(enum_cls) -> tuple[tuple[str, object], ...]:
+    # Shared by every editor instance; the labels never change at runtime.
+    return tuple((member.name.replace("_", " ").title(), member) for member in enum_cls)
+
+
+def _sub_signature(entry: ObjectEntry) -> tuple:
+    return tuple((subindex, id(sub), sub.name) for subindex, sub in entry.sorted_sub_items())
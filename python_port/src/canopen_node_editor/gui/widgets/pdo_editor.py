@@ -3,9 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from functools import partial
 
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QTimer
 from PySide6.QtWidgets import (
     QComboBox,
     QGroupBox,
@@ -21,6 +20,11 @@ from PySide6.QtWidgets import (
 
 from ...model import Device, ObjectEntry, PDOMapping, SubObject
 
+# New table items start editable; read-only cells get these flags directly
+# instead of reading and masking each item's flags.
+_READ_ONLY_FLAGS = QTableWidgetItem().flags() & ~Qt.ItemFlag.ItemIsEditable
+# Model field edited through each table column; None marks read-only columns.
+_COLUMN_FIELDS = (None, None, "name", "value", "default")
 
 _DATA_TYPE_BIT_LENGTH = {
     # Integer types -----------------------------------------------------
@@ -79,9 +83,16 @@ class _PDOSection:
 class PDOEditorWidget(QWidget):
     """Display RPDO/TPDO assignments in a tabular form."""
 
+    #: Quiet period after the last selector move before the tables are rebuilt.
+    SELECTION_REFRESH_DELAY_MS = 50
+
     def __init__(self, parent=None) -> None:
         super().__init__(parent)
         self._device: Device | None = None
+        # Mappable objects per PDO direction, valid until the device changes.
+        self._mappable_cache: dict[
+            PDOMapping, list[tuple[ObjectEntry, SubObject | None]]
+        ] = {}
         self._field_role = Qt.UserRole + 1
 
         tpdo_section = self._build_section(
@@ -99,6 +110,10 @@ class PDOEditorWidget(QWidget):
             PDOMapping.TPDO: tpdo_section,
             PDOMapping.RPDO: rpdo_section,
         }
+        self._mapping_type_by_selector: dict[QListWidget, PDOMapping] = {
+            section.selector: mapping_type
+            for mapping_type, section in self._sections.items()
+        }
 
         splitter = QSplitter(Qt.Horizontal, self)
         splitter.setChildrenCollapsible(False)
@@ -111,13 +126,19 @@ class PDOEditorWidget(QWidget):
         for section in self._sections.values():
             for table in (section.communication, section.mapping):
                 self._configure_table(table)
-            section.selector.currentRowChanged.connect(
-                partial(self._on_selector_changed, section)
-            )
+            section.selector.currentRowChanged.connect(self._on_selector_changed)
+
+        # Sections whose selector moved since their tables were last filled.
+        self._pending_sections: set[PDOMapping] = set()
+        self._selection_timer = QTimer(self)
+        self._selection_timer.setSingleShot(True)
+        self._selection_timer.setInterval(self.SELECTION_REFRESH_DELAY_MS)
+        self._selection_timer.timeout.connect(self._flush_pending_sections)
 
     # ------------------------------------------------------------------
     def set_device(self, device: Device | None) -> None:
         self._device = device
+        self._mappable_cache.clear()
         for mapping_type, section in self._sections.items():
             previous = self._selected_descriptor(section)
             section.descriptors = self._collect_descriptors(section, device)
@@ -125,6 +146,10 @@ class PDOEditorWidget(QWidget):
             target_number = previous.number if previous is not None else None
             self._restore_selection(section, target_number)
             self._populate_section_tables(mapping_type)
+        # Every section was just filled; drop refreshes queued by the
+        # selection restore above.
+        self._selection_timer.stop()
+        self._pending_sections.clear()
 
     # ------------------------------------------------------------------
     def tpdo_selector(self) -> QListWidget:
@@ -146,19 +171,19 @@ class PDOEditorWidget(QWidget):
         return self._sections[PDOMapping.RPDO].communication
 
     # ------------------------------------------------------------------
-    def _on_selector_changed(self, section: _PDOSection, _row: int) -> None:
-        mapping_type = self._mapping_type_for_section(section)
+    def _on_selector_changed(self, _row: int) -> None:
+        mapping_type = self._mapping_type_by_selector.get(self.sender())
         if mapping_type is None:
             return
-        self._populate_section_tables(mapping_type)
-
-    def _mapping_type_for_section(
-        self, target: _PDOSection
-    ) -> PDOMapping | None:
-        for mapping_type, section in self._sections.items():
-            if section is target:
-                return mapping_type
-        return None
+        # Held arrow keys move the selector faster than the tables can be
+        # rebuilt; only the row it settles on is filled.
+        self._pending_sections.add(mapping_type)
+        self._selection_timer.start()
+
+    def _flush_pending_sections(self) -> None:
+        pending, self._pending_sections = self._pending_sections, set()
+        for mapping_type in pending:
+            self._populate_section_tables(mapping_type)
 
     # ------------------------------------------------------------------
     def _build_section(
@@ -254,7 +279,7 @@ class PDOEditorWidget(QWidget):
             | QTableWidget.SelectedClicked
         )
         table.setEditTriggers(triggers)
-        table.itemChanged.connect(partial(self._on_table_item_changed, table))
+        table.itemChanged.connect(self._on_table_item_changed)
 
     # ------------------------------------------------------------------
     def _collect_descriptors(
@@ -263,16 +288,16 @@ class PDOEditorWidget(QWidget):
         if device is None:
             return []
         descriptors: dict[int, _PDODescriptor] = {}
-        for entry in device.all_entries():
-            index = entry.index
-            if section.communication_start <= index <= section.communication_end:
-                number = index - section.communication_start
-                descriptor = descriptors.setdefault(number, _PDODescriptor(number))
-                descriptor.communication = entry
-            elif section.mapping_start <= index <= section.mapping_end:
-                number = index - section.mapping_start
-                descriptor = descriptors.setdefault(number, _PDODescriptor(number))
-                descriptor.mapping = entry
+        start, end = section.communication_start, section.communication_end
+        for entry in device.entries_in_range(start, end):
+            number = entry.index - start
+            descriptor = descriptors.setdefault(number, _PDODescriptor(number))
+            descriptor.communication = entry
+        start, end = section.mapping_start, section.mapping_end
+        for entry in device.entries_in_range(start, end):
+            number = entry.index - start
+            descriptor = descriptors.setdefault(number, _PDODescriptor(number))
+            descriptor.mapping = entry
         return [descriptors[key] for key in sorted(descriptors)]
 
     def _populate_selector(self, section: _PDOSection) -> None:
@@ -353,7 +378,7 @@ class PDOEditorWidget(QWidget):
         rows: list[tuple[ObjectEntry, SubObject | None]] = []
         if entry is not None:
             if entry.sub_objects:
-                for subindex, sub in sorted(entry.sub_objects.items()):
+                for subindex, sub in entry.sorted_sub_items():
                     rows.append((entry, sub))
             else:
                 rows.append((entry, None))
@@ -382,31 +407,43 @@ class PDOEditorWidget(QWidget):
         mapping_entry: ObjectEntry | None = None,
         mapping_options: list[tuple[ObjectEntry, SubObject | None]] | None = None,
     ) -> None:
+        # Content-sized columns would re-measure on every setItem; size them
+        # once after the fill instead, with repaints held off meanwhile.
+        header = table.horizontalHeader()
+        modes = [header.sectionResizeMode(column) for column in range(header.count())]
+        for column, mode in enumerate(modes):
+            if mode == QHeaderView.ResizeToContents:
+                header.setSectionResizeMode(column, QHeaderView.Interactive)
+        table.setUpdatesEnabled(False)
         table.blockSignals(True)
+        try:
+            self._write_rows(table, entries, mapping_entry, mapping_options)
+        finally:
+            table.blockSignals(False)
+            for column, mode in enumerate(modes):
+                if mode == QHeaderView.ResizeToContents:
+                    header.setSectionResizeMode(column, mode)
+            table.setUpdatesEnabled(True)
+
+    def _write_rows(
+        self,
+        table: QTableWidget,
+        entries: list[tuple[ObjectEntry, SubObject | None]],
+        mapping_entry: ObjectEntry | None,
+        mapping_options: list[tuple[ObjectEntry, SubObject | None]] | None,
+    ) -> None:
         table.setRowCount(len(entries))
+        field_role = self._field_role
+        set_item = table.setItem
+        read_only = _READ_ONLY_FLAGS
         for row, (entry, sub) in enumerate(entries):
-            index_item = QTableWidgetItem(f"0x{entry.index:04X}")
-            subindex_text = f"{sub.key.subindex:02X}" if sub else "-"
-            subindex_item = QTableWidgetItem(subindex_text)
-            name_item = QTableWidgetItem(sub.name if sub else entry.name)
-            value_item = QTableWidgetItem(self._value_text(entry, sub))
-            default_item = QTableWidgetItem(self._default_text(entry, sub))
-
-            columns = [
-                (index_item, None),
-                (subindex_item, None),
-                (name_item, "name"),
-                (value_item, "value"),
-                (default_item, "default"),
-            ]
-
-            for column, (item, field) in enumerate(columns):
+            for column, (text, field) in enumerate(zip(_row_texts(entry, sub), _COLUMN_FIELDS)):
+                item = QTableWidgetItem(text)
                 if field is None:
-                    item.setFlags(item.flags() & ~Qt.ItemFlag.ItemIsEditable)
+                    item.setFlags(read_only)
                 else:
-                    item.setFlags(item.flags() | Qt.ItemFlag.ItemIsEditable)
-                    item.setData(self._field_role, (entry, sub, field))
-                table.setItem(row, column, item)
+                    item.setData(field_role, (entry, sub, field))
+                set_item(row, column, item)
 
             if (
                 mapping_entry is not None
@@ -418,49 +455,43 @@ class PDOEditorWidget(QWidget):
                 self._attach_mapping_selector(
                     table,
                     row,
-                    value_item,
+                    table.item(row, 3),
                     entry,
                     sub,
                     mapping_options,
                 )
-        table.blockSignals(False)
 
     def _collect_mappable_entries(
         self, mapping_type: PDOMapping
     ) -> list[tuple[ObjectEntry, SubObject | None]]:
         if self._device is None:
             return []
-        section = self._sections[mapping_type]
-        entries: list[tuple[ObjectEntry, SubObject | None]] = []
-        for entry in self._device.all_entries():
-            if section.mapping_start <= entry.index <= section.mapping_end:
-                continue
-            if entry.pdo_mapping == mapping_type:
-                entries.append((entry, None))
-            for subindex, sub in sorted(entry.sub_objects.items()):
-                if sub.pdo_mapping == mapping_type:
-                    entries.append((entry, sub))
-        return entries
-
-    def _value_text(self, entry: ObjectEntry, sub: SubObject | None) -> str:
-        if sub and sub.value:
-            return sub.value
-        if not sub and entry.value:
-            return entry.value
-        if sub and sub.default:
-            return sub.default
-        if entry.default:
-            return entry.default
-        return ""
-
-    def _default_text(self, entry: ObjectEntry, sub: SubObject | None) -> str:
-        if sub and sub.default:
-            return sub.default
-        if not sub and entry.default:
-            return entry.default
-        return ""
-
-    def _on_table_item_changed(self, table: QTableWidget, item: QTableWidgetItem) -> None:
+        if not self._mappable_cache:
+            self._mappable_cache = self._bucket_mappable_entries(self._device)
+        return self._mappable_cache[mapping_type]
+
+    def _bucket_mappable_entries(
+        self, device: Device
+    ) -> dict[PDOMapping, list[tuple[ObjectEntry, SubObject | None]]]:
+        # One walk over the dictionary fills the lists for both directions.
+        buckets: dict[PDOMapping, list[tuple[ObjectEntry, SubObject | None]]] = {
+            mapping_type: [] for mapping_type in self._sections
+        }
+        sections = self._sections
+        for entry in device.all_entries():
+            index = entry.index
+            if entry.pdo_mapping in buckets:
+                section = sections[entry.pdo_mapping]
+                if not section.mapping_start <= index <= section.mapping_end:
+                    buckets[entry.pdo_mapping].append((entry, None))
+            for _, sub in entry.sorted_sub_items():
+                if sub.pdo_mapping in buckets:
+                    section = sections[sub.pdo_mapping]
+                    if not section.mapping_start <= index <= section.mapping_end:
+                        buckets[sub.pdo_mapping].append((entry, sub))
+        return buckets
+
+    def _on_table_item_changed(self, item: QTableWidgetItem) -> None:
         payload = item.data(self._field_role)
         if not isinstance(payload, tuple) or len(payload) != 3:
             return
@@ -573,3 +604,15 @@ class PDOEditorWidget(QWidget):
         if data_type is None:
             return None
         return _DATA_TYPE_BIT_LENGTH.get(data_type.name)
+
+
+def _row_texts(entry: ObjectEntry, sub: SubObject | None) -> tuple[str, str, str, str, str]:
+    # Index, subindex, name, value and default text of one table row. The
+    # value falls back to the default, and a sub-index to its entry's default.
+    if sub is None:
+        default = entry.default or ""
+        return (f"0x{entry.index:04X}", "-", entry.name, entry.value or default, default)
+    default = sub.default or ""
+    value = sub.value or default or entry.default or ""
+    return (f"0x{entry.index:04X}", f"{sub.key.subindex:02X}", sub.name, value, default)
+
@@ -37,8 +37,7 @@ class PropertyInspectorWidget(QWidget):
         self._current_entry = entry
         self._current_sub = sub
         if entry is None:
-            self._header.setText(self.tr("No selection"))
-            self._body.setText("")
+            self._show(self.tr("No selection"), "")
             return
 
         if sub is None:
@@ -68,8 +67,15 @@ class PropertyInspectorWidget(QWidget):
             if sub.pdo_mapping:
                 details.append(self.tr("PDO Mapping: {mapping}").format(mapping=sub.pdo_mapping.name))
 
-        self._header.setText(title)
-        self._body.setText("\n".join(details))
+        self._show(title, "\n".join(details))
+
+    def _show(self, title: str, body: str) -> None:
+        # setText re-lays out word-wrapped labels even for identical text,
+        # which is the common case when re-selecting within one entry.
+        if self._header.text() != title:
+            self._header.setText(title)
+        if self._body.text() != body:
+            self._body.setText(body)
 
     def current_entry(self) -> ObjectEntry | None:
         return self._current_entry
@@ -1,5 +1,13 @@
 """Domain model exports for the CANopenNode Editor."""
-from .device import Device, DeviceInfo, ObjectEntry, SubObject, merge_devices
+from .device import (
+    Device,
+    DeviceInfo,
+    ObjectEntry,
+    ObjectMap,
+    SubObject,
+    SubObjectMap,
+    merge_devices,
+)
 from .enums import AccessType, DataType, ObjectKey, ObjectType, PDOMapping
 from .templates import create_empty_device, create_minimal_profile_device
 
@@ -7,7 +15,9 @@ __all__ = [
     "Device",
     "DeviceInfo",
     "ObjectEntry",
+    "ObjectMap",
     "SubObject",
+    "SubObjectMap",
     "merge_devices",
     "AccessType",
     "DataType",
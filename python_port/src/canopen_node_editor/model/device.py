@@ -1,11 +1,15 @@
 """Core data model abstractions for the CANopenNode Editor port."""
 from __future__ import annotations
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Optional
+from typing import Any, Dict, Generic, Iterable, List, Mapping, Optional, Tuple, TypeVar, Union
 
 from .enums import AccessType, DataType, ObjectKey, ObjectType, PDOMapping
 
+_V = TypeVar("_V")
+_M = TypeVar("_M", bound="_IndexKeyedMap[Any]")
+
 
 @dataclass
 class SubObject:
@@ -22,6 +26,117 @@ class SubObject:
     pdo_mapping: Optional[PDOMapping] = None
 
 
+class _IndexKeyedMap(Dict[int, _V]):
+    """``dict`` keyed by (sub)index that caches its items in key order.
+
+    Every mutating ``dict`` method drops the cache, so :meth:`sorted_items`
+    only sorts again after the mapping actually changed.
+    """
+
+    _sorted: Optional[List[Tuple[int, _V]]] = None
+
+    def sorted_items(self) -> List[Tuple[int, _V]]:
+        """Return ``(key, value)`` pairs ordered by key.
+
+        The returned list is shared between callers and must not be mutated.
+        """
+
+        cached = self._sorted
+        if cached is None:
+            cached = self._sorted = sorted(self.items())
+        return cached
+
+    def __setitem__(self, key: int, value: _V) -> None:
+        self._sorted = None
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: int) -> None:
+        self._sorted = None
+        super().__delitem__(key)
+
+    def __ior__(self, other):  # type: ignore[override, misc]
+        self._sorted = None
+        return super().__ior__(other)
+
+    def clear(self) -> None:
+        self._sorted = None
+        super().clear()
+
+    def pop(self, *args):  # type: ignore[override]
+        self._sorted = None
+        return super().pop(*args)
+
+    def popitem(self) -> Tuple[int, _V]:
+        self._sorted = None
+        return super().popitem()
+
+    def setdefault(self, key: int, default: _V) -> _V:  # type: ignore[override]
+        self._sorted = None
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs) -> None:  # type: ignore[override]
+        self._sorted = None
+        super().update(*args, **kwargs)
+
+
+class SubObjectMap(_IndexKeyedMap[SubObject]):
+    """Mapping of subindex to :class:`SubObject` caching its sorted items."""
+
+
+class ObjectMap(_IndexKeyedMap["ObjectEntry"]):
+    """Mapping of index to :class:`ObjectEntry` caching the sorted entries."""
+
+    _sorted_values: Optional[List["ObjectEntry"]] = None
+    _sorted_keys: Optional[List[int]] = None
+    _values_source: Optional[List[Tuple[int, "ObjectEntry"]]] = None
+
+    def sorted_values(self) -> List["ObjectEntry"]:
+        """Return entries ordered by index; shared, must not be mutated."""
+
+        items = self.sorted_items()
+        if items is not self._values_source:
+            self._values_source = items
+            self._sorted_keys = [index for index, _ in items]
+            self._sorted_values = [entry for _, entry in items]
+        return self._sorted_values  # type: ignore[return-value]
+
+    def values_between(self, start: int, end: int) -> List["ObjectEntry"]:
+        """Return entries with ``start <= index <= end``, ordered by index."""
+
+        values = self.sorted_values()
+        keys = self._sorted_keys
+        return values[bisect_left(keys, start) : bisect_right(keys, end)]  # type: ignore[arg-type]
+
+
+class _IndexKeyedField(Generic[_M]):
+    """Dataclass field that stores whatever mapping is assigned as ``map_type``.
+
+    Plain ``dict`` values, including the constructor argument, are copied into
+    ``map_type`` on assignment, so the sorted-order helpers are always there.
+    """
+
+    def __init__(self, map_type: type[_M]) -> None:
+        self._map_type = map_type
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    def __get__(self, obj: object, owner: Optional[type] = None) -> _M:
+        if obj is None:
+            # Read by ``dataclass`` as the default; __set__ turns it into a
+            # fresh map per instance.
+            return ()  # type: ignore[return-value]
+        return obj.__dict__[self._name]
+
+    def __set__(
+        self, obj: object, value: Union[Mapping[int, Any], Iterable[Tuple[int, Any]]]
+    ) -> None:
+        if not isinstance(value, self._map_type):
+            value = self._map_type(value)
+        obj.__dict__[self._name] = value
+
+
 @dataclass
 class ObjectEntry:
     """Represents a primary object dictionary entry."""
@@ -36,7 +151,12 @@ class ObjectEntry:
     minimum: Optional[str] = None
     maximum: Optional[str] = None
     pdo_mapping: Optional[PDOMapping] = None
-    sub_objects: Dict[int, SubObject] = field(default_factory=dict)
+    sub_objects: _IndexKeyedField[SubObjectMap] = _IndexKeyedField(SubObjectMap)
+
+    def sorted_sub_items(self) -> List[Tuple[int, SubObject]]:
+        """Return sub-objects ordered by subindex, cached until they change."""
+
+        return self.sub_objects.sorted_items()
 
     def is_complex(self) -> bool:
         return bool(self.sub_objects)
@@ -63,7 +183,7 @@ class Device:
     """Unified representation of a CANopen device description."""
 
     info: DeviceInfo = field(default_factory=DeviceInfo)
-    objects: Dict[int, ObjectEntry] = field(default_factory=dict)
+    objects: _IndexKeyedField[ObjectMap] = _IndexKeyedField(ObjectMap)
 
     def add_object(self, entry: ObjectEntry) -> None:
         self.objects[entry.index] = entry
@@ -72,7 +192,17 @@ class Device:
         return self.objects.get(index)
 
     def all_entries(self) -> List[ObjectEntry]:
-        return sorted(self.objects.values(), key=lambda entry: entry.index)
+        """Return entries ordered by index, cached until ``objects`` changes.
+
+        The returned list is shared between callers and must not be mutated.
+        """
+
+        return self.objects.sorted_values()
+
+    def entries_in_range(self, start: int, end: int) -> List[ObjectEntry]:
+        """Return entries whose index lies in ``start..end`` (inclusive)."""
+
+        return self.objects.values_between(start, end)
 
     def to_dict(self) -> Dict[str, object]:
         """Return a serializable representation for debugging and tests."""
@@ -101,10 +231,10 @@ class Device:
                             "maximum": sub.maximum,
                             "pdo_mapping": sub.pdo_mapping.name if sub.pdo_mapping else None,
                         }
-                        for subindex, sub in sorted(entry.sub_objects.items())
+                        for subindex, sub in entry.sorted_sub_items()
                     },
                 }
-                for index, entry in sorted(self.objects.items())
+                for index, entry in self.objects.sorted_items()
             },
         }
 
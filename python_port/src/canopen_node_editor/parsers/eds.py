@@ -107,7 +107,7 @@ def serialize_device_to_eds(device: Device) -> str:
         if entry.pdo_mapping is not None:
             parser.set(section_name, "PDOMapping", entry.pdo_mapping.value)
 
-        for subindex, sub in sorted(entry.sub_objects.items()):
+        for subindex, sub in entry.sorted_sub_items():
             sub_section = f"{entry.index:04X}sub{subindex}"
             parser.add_section(sub_section)
             parser.set(sub_section, "ParameterName", sub.name)
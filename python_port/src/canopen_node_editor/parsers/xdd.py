@@ -595,7 +595,7 @@ def serialize_device_to_xdd(device: Device) -> str:
 
         if entry.sub_objects:
             sub_list = ET.SubElement(obj, "SubObjectList")
-            for subindex, sub in sorted(entry.sub_objects.items()):
+            for subindex, sub in entry.sorted_sub_items():
                 sub_node = ET.SubElement(sub_list, "SubObject", subIndex=str(subindex))
                 _write_text(sub_node, "Name", sub.name)
                 _write_text(sub_node, "DataType", sub.data_type.name)
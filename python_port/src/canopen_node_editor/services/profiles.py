@@ -1,6 +1,7 @@
 """Profile discovery and metadata extraction utilities."""
 from __future__ import annotations
 
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
@@ -24,6 +25,8 @@ class ProfileRepository:
 
     def __init__(self, search_paths: Iterable[Path] | None = None) -> None:
         self._search_paths: List[Path] = [Path(path) for path in search_paths or []]
+        self._cache_key: tuple | None = None
+        self._cached: List[ProfileMetadata] = []
 
     @property
     def search_paths(self) -> List[Path]:
@@ -33,6 +36,7 @@ class ProfileRepository:
         normalized = Path(path)
         if normalized not in self._search_paths:
             self._search_paths.append(normalized)
+            self._cache_key = None
 
     def discover(self) -> List[ProfileMetadata]:
         profiles: List[ProfileMetadata] = []
@@ -48,6 +52,36 @@ class ProfileRepository:
         unique: dict[Path, ProfileMetadata] = {profile.path: profile for profile in profiles}
         return sorted(unique.values(), key=lambda meta: meta.name.lower())
 
+    def discover_cached(self) -> List[ProfileMetadata]:
+        """Return :meth:`discover` results, rescanning only after changes.
+
+        The cache is keyed on the modification times of the search paths and
+        every directory below them, so adding, removing or renaming a profile
+        anywhere in the tree invalidates it without parsing any files. The
+        same list object is returned while the cache is valid.
+        """
+
+        key = self._tree_signature()
+        if key != self._cache_key:
+            self._cached = self.discover()
+            self._cache_key = key
+        return self._cached
+
+    def _tree_signature(self) -> tuple:
+        signature: list[tuple[str, int]] = []
+        for base in self._search_paths:
+            try:
+                signature.append((str(base), os.stat(base).st_mtime_ns))
+            except OSError:
+                signature.append((str(base), -1))
+                continue
+            for directory, _dirs, _files in os.walk(base):
+                try:
+                    signature.append((directory, os.stat(directory).st_mtime_ns))
+                except OSError:
+                    continue
+        return tuple(signature)
+
     def _load_profile(self, path: Path) -> List[ProfileMetadata]:
         try:
             device = self._parse_device(path)
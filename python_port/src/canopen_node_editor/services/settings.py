@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+import os
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Iterable, List
@@ -34,12 +35,14 @@ class SettingsManager:
         self._storage_dir.mkdir(parents=True, exist_ok=True)
         self._settings_path = self._storage_dir / "settings.json"
         self._preferences = UserPreferences()
+        self._loaded = False
 
     @property
     def storage_path(self) -> Path:
         return self._settings_path
 
     def load(self) -> UserPreferences:
+        self._loaded = True
         if not self._settings_path.exists():
             self._preferences = UserPreferences()
             return self._preferences
@@ -54,9 +57,19 @@ class SettingsManager:
         self._preferences = prefs
         return prefs
 
+    def cached_preferences(self) -> UserPreferences:
+        """Return the in-memory preferences, reading the file only once."""
+
+        if not self._loaded:
+            return self.load()
+        return self._preferences
+
     def save(self) -> None:
         payload = asdict(self._preferences)
-        self._settings_path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        # Write next to the target and rename so a crash never truncates it.
+        temporary = self._settings_path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+        os.replace(temporary, self._settings_path)
 
     def update_preferences(self, **changes: object) -> UserPreferences:
         for key, value in changes.items():
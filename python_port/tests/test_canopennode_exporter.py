@@ -1,9 +1,19 @@
+import os
+import subprocess
+import sys
+from io import StringIO
 from pathlib import Path
 
-from canopen_node_editor.exporters import export_header, export_source
+from canopen_node_editor.exporters import (
+    export_canopennode_sources,
+    export_header,
+    export_many,
+    export_source,
+)
 from canopen_node_editor.parsers import parse_eds
 
 SAMPLES = Path(__file__).resolve().parents[1] / "data" / "samples"
+_SRC_DIR = Path(__file__).resolve().parents[1] / "src"
 
 
 def _normalize_timestamp(text: str) -> str:
@@ -30,3 +40,60 @@ def test_source_export_matches_fixture():
     normalized = _normalize_timestamp(rendered)
     expected = (SAMPLES / "demo_device.c").read_text(encoding="utf-8")
     assert normalized == expected
+
+
+def test_export_writes_to_sink():
+    device = parse_eds(SAMPLES / "demo_device.eds")
+    sink = StringIO()
+
+    assert export_source(device, header_name="CO_OD.h", sink=sink) is None
+
+    expected = (SAMPLES / "demo_device.c").read_text(encoding="utf-8")
+    assert _normalize_timestamp(sink.getvalue()) == expected
+
+
+def test_include_guard_replaces_non_latin1_punctuation():
+    device = parse_eds(SAMPLES / "demo_device.eds")
+
+    header = export_header(device, header_name="dev\u2014od\u2026.h")
+
+    assert "#ifndef DEV_OD__H\n" in header
+
+
+def test_paired_exports_share_timestamp():
+    device = parse_eds(SAMPLES / "demo_device.eds")
+
+    rendered = export_canopennode_sources(device)
+
+    stamps = {
+        line
+        for text in rendered.values()
+        for line in text.splitlines()
+        if line.startswith(" * Generated:")
+    }
+    assert len(stamps) == 1
+
+
+def test_export_many_writes_each_device(tmp_path):
+    device = parse_eds(SAMPLES / "demo_device.eds")
+
+    exports = export_many({"first": device, "second": device}, tmp_path, max_workers=2)
+
+    expected = (SAMPLES / "demo_device.h").read_text(encoding="utf-8")
+    for name in ("first", "second"):
+        assert set(exports[name]) == {"CO_OD.h", "CO_OD.c"}
+        header = (tmp_path / name / "CO_OD.h").read_text(encoding="utf-8")
+        assert _normalize_timestamp(header) == expected
+
+
+def test_exporter_import_defers_process_pool():
+    script = (
+        "import sys\n"
+        "import canopen_node_editor.exporters\n"
+        "assert 'concurrent.futures.process' not in sys.modules\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(_SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
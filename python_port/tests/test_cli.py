@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
 from canopen_node_editor import __version__
 from canopen_node_editor.app import main
 
+_SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+
 
 def test_main_prints_version(capsys):
     exit_code = main(["--version"])
@@ -12,6 +21,40 @@ def test_main_prints_version(capsys):
     assert captured.out.strip() == __version__
 
 
+def test_version_fast_path_avoids_heavy_imports():
+    script = (
+        "import sys\n"
+        "from canopen_node_editor.app import main\n"
+        "main(['--version'])\n"
+        "heavy = ('argparse', 'PySide6', 'platformdirs', 'canopen_node_editor.services')\n"
+        "heavy = [name for name in heavy if name in sys.modules]\n"
+        "assert not heavy, heavy\n"
+    )
+    env = {**os.environ, "PYTHONPATH": str(_SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, "-c", script], env=env, capture_output=True, text=True
+    )
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == __version__
+
+
+def test_unknown_argument_reports_usage(capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main(["--bogus"])
+
+    assert excinfo.value.code == 2
+    assert "usage:" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("flag", ["--vers", "--che"])
+def test_abbreviated_flags_are_rejected(flag, capsys):
+    with pytest.raises(SystemExit) as excinfo:
+        main([flag])
+
+    assert excinfo.value.code == 2
+    assert "usage:" in capsys.readouterr().err
+
+
 def test_main_check_mode_reports_environment(capsys):
     exit_code = main(["--check"])
 
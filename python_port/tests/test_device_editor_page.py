@@ -135,3 +135,265 @@ def test_subindex_pdo_mapping_updates_pdo_editor(qtbot):
         return False
 
     qtbot.waitUntil(combo_contains_entry)
+
+
+@pytest.mark.qt
+def test_entry_edits_revalidate_once_per_tick(qtbot):
+    device = parse_xdd(SAMPLES / "od.xdd")
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+    entry = device.all_entries()[0]
+    assert not any(issue.code == "MISSING_DATATYPE" for issue in page.issues)
+
+    entry.object_type = ObjectType.VAR
+    entry.data_type = None
+    with qtbot.waitSignal(page.issuesChanged, timeout=1000):
+        page._on_entry_changed(entry)
+        page._on_entry_changed(entry)
+
+    assert [issue.index for issue in page.issues if issue.code == "MISSING_DATATYPE"] == [
+        entry.index
+    ]
+
+
+@pytest.mark.qt
+def test_entry_edit_bursts_refresh_pdo_editor_once(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "od.xdd")
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+    page._tabs.setCurrentWidget(page._pdo_page)
+
+    calls = []
+    monkeypatch.setattr(page.pdo_editor, "set_device", calls.append)
+    entry = device.all_entries()[0]
+    for _ in range(3):
+        page._on_entry_changed(entry)
+        page._on_sub_entry_changed(entry, None)
+    assert calls == []
+
+    qtbot.waitUntil(lambda: calls == [device], timeout=1000)
+
+
+@pytest.mark.qt
+def test_refresh_skips_unchanged_summary(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "od.xdd")
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+    page._tabs.setCurrentWidget(page._overview_page)
+
+    rendered = []
+    monkeypatch.setattr(page._summary, "setHtml", rendered.append)
+    page.refresh()
+    assert rendered == []
+
+    device.info.product_name = "Renamed product"
+    page.refresh()
+    assert len(rendered) == 1 and "Renamed product" in rendered[0]
+
+
+@pytest.mark.qt
+def test_title_uses_static_text(qtbot):
+    device = parse_xdd(SAMPLES / "od.xdd")
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+    page._tabs.setCurrentWidget(page._overview_page)
+
+    title = page._title
+    assert title._static.text() == page._format_title()
+    assert title.sizeHint().height() > 0
+
+    device.info.product_name = "Renamed product"
+    page.refresh()
+    assert "Renamed product" in title.text()
+
+
+@pytest.mark.qt
+def test_secondary_tabs_build_on_first_show(qtbot):
+    device = parse_xdd(SAMPLES / "od.xdd")
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+
+    assert page._pdo_editor is None
+    assert page._summary is None
+    assert page._report_view is None
+
+    page._tabs.setCurrentWidget(page._overview_page)
+    assert page._summary is not None
+    assert page._summary.toPlainText()
+
+    page.show_validation_report()
+    assert page._report_view is not None
+    assert page.report_view.issues() == page.issues
+    assert page._pdo_editor is None
+
+
+def _record(index: int, count: int) -> ObjectEntry:
+    entry = ObjectEntry(
+        index=index,
+        name=f"Record {index:04X}",
+        object_type=ObjectType.RECORD,
+        data_type=None,
+        access_type=None,
+    )
+    entry.sub_objects = {
+        subindex: SubObject(
+            key=ObjectKey(index=index, subindex=subindex),
+            name=f"Sub {subindex}",
+            data_type=DataType.UNSIGNED8,
+            access_type=AccessType.RW,
+        )
+        for subindex in range(count)
+    }
+    return entry
+
+
+@pytest.mark.qt
+def test_entry_editor_reuses_sub_list_rows(qtbot):
+    device = Device()
+    first, second = _record(0x2000, 3), _record(0x2001, 2)
+    device.add_object(first)
+    device.add_object(second)
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+
+    editor = page.object_editor
+    editor.set_entry(first)
+    sub_list = editor._sub_list
+    kept = sub_list.item(0)
+
+    editor.set_entry(second)
+    assert sub_list.count() == 2
+    assert sub_list.item(0) is kept
+    assert editor.current_subobject() is second.sub_objects[0]
+    assert editor._row_subs == [
+        second.sub_objects[0],
+        second.sub_objects[1],
+    ]
+
+
+@pytest.mark.qt
+def test_entry_editor_loads_sub_form_once_per_entry(qtbot, monkeypatch):
+    device = Device()
+    record = _record(0x2000, 2)
+    device.add_object(record)
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+
+    editor = page.object_editor
+    loads = []
+    original = editor._load_sub_fields
+    monkeypatch.setattr(editor, "_load_sub_fields", lambda sub: (loads.append(sub), original(sub)))
+
+    editor.set_entry(None)
+    assert loads == [None]
+    editor.set_entry(None)
+    assert loads == [None]
+
+    editor.set_entry(record)
+    assert loads == [None, record.sub_objects[0]]
+
+
+@pytest.mark.qt
+def test_entry_editor_announces_typing_once(qtbot):
+    device = Device()
+    record = _record(0x2000, 1)
+    device.add_object(record)
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+
+    editor = page.object_editor
+    editor.set_entry(record)
+    emitted = []
+    editor.entryChanged.connect(emitted.append)
+
+    editor._entry_name.clear()
+    qtbot.keyClicks(editor._entry_name, "Renamed")
+    assert record.name == "Renamed"
+    assert emitted == []
+
+    qtbot.waitUntil(lambda: emitted == [record], timeout=1000)
+
+
+@pytest.mark.qt
+def test_entry_editor_refreshes_sub_label_by_row_lookup(qtbot):
+    device = Device()
+    record = _record(0x2000, 3)
+    device.add_object(record)
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+
+    editor = page.object_editor
+    editor.set_entry(record)
+    sub = record.sub_objects[2]
+    assert editor._sub_row_of[id(sub)] == 2
+
+    sub.name = "Renamed"
+    editor._refresh_sub_label(sub)
+    assert editor._sub_list.item(2).text().endswith("Renamed")
+
+
+@pytest.mark.qt
+def test_entry_editor_enum_combos_share_labels(qtbot):
+    device = Device()
+    record = _record(0x2000, 1)
+    device.add_object(record)
+    first = DeviceEditorPage(device)
+    second = DeviceEditorPage(device)
+    qtbot.addWidget(first)
+    qtbot.addWidget(second)
+
+    combo = first.object_editor._entry_object_type
+    assert combo.itemText(1) == second.object_editor._entry_object_type.itemText(1)
+
+    first.object_editor.set_entry(record)
+    assert combo.currentData() == record.object_type
+
+
+@pytest.mark.qt
+def test_entry_editor_keeps_sub_list_when_reselected(qtbot, monkeypatch):
+    device = Device()
+    record = _record(0x2000, 3)
+    device.add_object(record)
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+
+    editor = page.object_editor
+    editor.set_entry(record)
+    editor._sub_list.setCurrentRow(2)
+    fills = []
+    original = editor._fill_sub_list
+    monkeypatch.setattr(editor, "_fill_sub_list", lambda entry: (fills.append(entry), original(entry)))
+
+    record.value = "7"
+    editor.set_entry(record)
+    assert fills == []
+    assert editor._entry_value.text() == "7"
+    assert editor._sub_list.currentRow() == 2
+
+    record.sub_objects[3] = SubObject(
+        key=ObjectKey(index=0x2000, subindex=3),
+        name="New",
+        data_type=DataType.UNSIGNED8,
+        access_type=AccessType.RW,
+    )
+    editor.set_entry(record)
+    assert fills == [record]
+
+
+@pytest.mark.qt
+def test_hidden_pdo_editor_refreshes_when_shown(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "od.xdd")
+    page = DeviceEditorPage(device)
+    qtbot.addWidget(page)
+    editor = page.pdo_editor
+
+    calls = []
+    monkeypatch.setattr(editor, "set_device", calls.append)
+    page.refresh()
+    assert calls == []
+
+    page._tabs.setCurrentWidget(page._pdo_page)
+    assert calls == [device]
+    page._tabs.setCurrentIndex(0)
+    page._tabs.setCurrentWidget(page._pdo_page)
+    assert calls == [device]
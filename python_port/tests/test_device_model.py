@@ -0,0 +1,94 @@
+import pickle
+
+from canopen_node_editor.model import (
+    AccessType,
+    DataType,
+    Device,
+    ObjectEntry,
+    ObjectMap,
+    ObjectKey,
+    ObjectType,
+    SubObject,
+    SubObjectMap,
+)
+
+
+def _sub(subindex: int) -> SubObject:
+    return SubObject(
+        key=ObjectKey(index=0x2000, subindex=subindex),
+        name=f"Sub {subindex}",
+        data_type=DataType.UNSIGNED8,
+        access_type=AccessType.RW,
+    )
+
+
+def _record() -> ObjectEntry:
+    return ObjectEntry(
+        index=0x2000,
+        name="Record",
+        object_type=ObjectType.RECORD,
+        data_type=None,
+        access_type=None,
+    )
+
+
+def test_sorted_sub_items_tracks_mutations():
+    entry = _record()
+    entry.sub_objects = {2: _sub(2), 0: _sub(0)}
+    assert isinstance(entry.sub_objects, SubObjectMap)
+
+    first = entry.sorted_sub_items()
+    assert [subindex for subindex, _ in first] == [0, 2]
+    assert entry.sorted_sub_items() is first
+
+    entry.sub_objects[1] = _sub(1)
+    assert [subindex for subindex, _ in entry.sorted_sub_items()] == [0, 1, 2]
+
+    replacement = _sub(2)
+    entry.sub_objects.update({2: replacement})
+    assert entry.sorted_sub_items()[-1][1] is replacement
+
+    del entry.sub_objects[0]
+    assert [subindex for subindex, _ in entry.sorted_sub_items()] == [1, 2]
+
+
+def test_entry_with_sub_objects_round_trips_through_pickle():
+    entry = _record()
+    entry.sub_objects[1] = _sub(1)
+    entry.sorted_sub_items()
+
+    restored = pickle.loads(pickle.dumps(entry))
+
+    assert restored == entry
+    restored.sub_objects[0] = _sub(0)
+    assert [subindex for subindex, _ in restored.sorted_sub_items()] == [0, 1]
+
+
+def test_all_entries_is_cached_until_objects_change():
+    def var(index: int) -> ObjectEntry:
+        return ObjectEntry(index, f"Object {index:04X}", ObjectType.VAR, DataType.UNSIGNED8, AccessType.RW)
+
+    device = Device(objects={0x2001: var(0x2001), 0x1000: var(0x1000)})
+    assert isinstance(device.objects, ObjectMap)
+
+    first = device.all_entries()
+    assert [entry.index for entry in first] == [0x1000, 0x2001]
+    assert device.all_entries() is first
+
+    device.add_object(var(0x1800))
+    assert [entry.index for entry in device.all_entries()] == [0x1000, 0x1800, 0x2001]
+
+    device.objects.pop(0x1000)
+    assert [entry.index for entry in device.all_entries()] == [0x1800, 0x2001]
+
+
+def test_entries_in_range_is_inclusive_and_tracks_mutations():
+    def var(index: int) -> ObjectEntry:
+        return ObjectEntry(index, f"Object {index:04X}", ObjectType.VAR, DataType.UNSIGNED8, AccessType.RW)
+
+    device = Device(objects={index: var(index) for index in (0x1000, 0x1400, 0x1401, 0x15FF, 0x1600)})
+    assert [entry.index for entry in device.entries_in_range(0x1400, 0x15FF)] == [0x1400, 0x1401, 0x15FF]
+    assert device.entries_in_range(0x1800, 0x19FF) == []
+
+    device.add_object(var(0x1402))
+    assert [entry.index for entry in device.entries_in_range(0x1401, 0x1402)] == [0x1401, 0x1402]
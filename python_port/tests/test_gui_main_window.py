@@ -9,11 +9,14 @@ import pytest
 
 pytest.importorskip("PySide6")
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QMessageBox
 
+from canopen_node_editor.gui.dialogs import AddObjectDialog
 from canopen_node_editor.gui.main_window import EditorMainWindow
+from canopen_node_editor.gui.widgets.command_palette import Command, CommandPalette
 from canopen_node_editor.gui.widgets.device_page import DeviceEditorPage
-from canopen_node_editor.model import Device
+from canopen_node_editor.model import DataType, Device
 from canopen_node_editor.parsers import parse_eds
 from canopen_node_editor.services.network import NetworkManager
 from canopen_node_editor.services.profiles import ProfileRepository
@@ -130,3 +133,123 @@ def test_incomplete_xdd_populates_tree(monkeypatch, qtbot, settings_manager):
         for row in range(page.object_dictionary.model().rowCount())
     ]
     assert "0x2000" in rows
+
+
+@pytest.mark.usefixtures("qapp")
+def test_command_palette_filters_by_visibility():
+    palette = CommandPalette(
+        [
+            Command("Open Project", lambda: None),
+            Command("Export Sources", lambda: None),
+            Command("Toggle Theme", lambda: None),
+        ]
+    )
+    items = [palette._list.item(row) for row in range(palette._list.count())]
+
+    palette._filter.setText("exp")
+    palette._rebuild()
+    assert [item.isHidden() for item in items] == [True, False, True]
+    assert palette._list.currentItem() is items[1]
+
+    palette._filter.setText("tgth")
+    palette._rebuild()
+    assert [item.isHidden() for item in items] == [True, True, False]
+    assert [palette._list.item(row) for row in range(palette._list.count())] == items
+    palette.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_command_palette_debounces_filter(qtbot):
+    palette = CommandPalette([Command("Open Project", lambda: None), Command("Export", lambda: None)])
+    first = palette._list.item(0)
+
+    palette._filter.setText("exp")
+    assert first.isHidden() is False
+
+    qtbot.waitUntil(first.isHidden, timeout=1000)
+    palette.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_recent_files_menu_reuses_actions(settings_manager, tmp_path):
+    window = EditorMainWindow(
+        NetworkManager(), settings_manager, profile_repository=ProfileRepository([])
+    )
+    actions = list(window._recent_menu.actions())
+    assert window._action_no_recent.isVisible()
+
+    settings_manager.add_recent_file(tmp_path / "first.eds")
+    settings_manager.add_recent_file(tmp_path / "second.eds")
+    window._refresh_recent_files()
+
+    assert window._recent_menu.actions() == actions
+    visible = [action.text() for action in actions if action.isVisible()]
+    assert visible == ["second.eds", "first.eds"]
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_add_object_dialog_reset_restores_defaults():
+    dialog = AddObjectDialog()
+    dialog._index_edit.setText("0x2000")
+    dialog._data_type.setCurrentIndex(0)
+    dialog._on_accept()
+    assert dialog.request() is not None
+
+    dialog.reset()
+
+    assert dialog.request() is None
+    assert dialog._index_edit.text() == ""
+    assert dialog._data_type.currentData() is DataType.UNSIGNED32
+    dialog.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_unchanged_window_state_is_not_rewritten(settings_manager):
+    window = EditorMainWindow(
+        NetworkManager(), settings_manager, profile_repository=ProfileRepository([])
+    )
+    window._save_window_state()
+    assert settings_manager.storage_path.exists()
+
+    settings_manager.storage_path.unlink()
+    window._save_window_state()
+    assert not settings_manager.storage_path.exists()
+    window.close()
+
+
+@pytest.mark.usefixtures("qapp")
+def test_command_palette_arrow_keys_skip_hidden_items(qtbot):
+    triggered: list[str] = []
+    palette = CommandPalette(
+        [
+            Command("Export Sources", lambda: triggered.append("sources")),
+            Command("Open Project", lambda: triggered.append("open")),
+            Command("Export Report", lambda: triggered.append("report")),
+        ]
+    )
+    qtbot.addWidget(palette)
+    palette._filter.setText("export")
+
+    qtbot.keyClick(palette._filter, Qt.Key_Down)
+    assert palette._list.currentItem().text() == "Export Report"
+
+    qtbot.keyClick(palette._filter, Qt.Key_Return)
+    assert triggered == ["report"]
+
+
+@pytest.mark.usefixtures("qapp")
+def test_recent_file_actions_share_one_slot(monkeypatch, settings_manager, tmp_path):
+    window = EditorMainWindow(
+        NetworkManager(), settings_manager, profile_repository=ProfileRepository([])
+    )
+    opened: list[str] = []
+    monkeypatch.setattr(window, "_open_recent_file", opened.append)
+    settings_manager.add_recent_file(tmp_path / "first.eds")
+    settings_manager.add_recent_file(tmp_path / "second.eds")
+    window._refresh_recent_files()
+
+    window._action_recent[1].trigger()
+
+    assert opened == [str((tmp_path / "first.eds").resolve())]
+    window.close()
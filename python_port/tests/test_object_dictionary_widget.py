@@ -1,10 +1,23 @@
+import sys
 from pathlib import Path
 
 import pytest
 
 pytest.importorskip("PySide6")
 
+from PySide6.QtCore import Qt
+
+from canopen_node_editor.gui.models.object_dictionary import ObjectDictionaryModel
 from canopen_node_editor.gui.widgets.object_dictionary import ObjectDictionaryWidget
+from canopen_node_editor.model import (
+    AccessType,
+    DataType,
+    Device,
+    ObjectEntry,
+    ObjectKey,
+    ObjectType,
+    SubObject,
+)
 from canopen_node_editor.parsers import parse_xdd
 
 SAMPLES = Path(__file__).resolve().parents[1] / "od_examples"
@@ -62,3 +75,311 @@ def test_editing_value_updates_device_model(qtbot):
     model.setData(value_index, "0x12345678")
 
     assert device.get_object(0x1000).value == "0x12345678"
+
+
+@pytest.mark.qt
+def test_refresh_updates_rows_in_place(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    model = widget.model()
+    rows = {model.item(row, 0).text(): row for row in range(model.rowCount())}
+    untouched = model.item(rows["0x1000"], 0)
+    renamed = device.get_object(0x1600)
+    renamed.name = "Renamed mapping"
+    removed = next(index for index in device.objects if index not in (0x1000, 0x1600))
+    del device.objects[removed]
+
+    widget.refresh()
+
+    texts = [model.item(row, 0).text() for row in range(model.rowCount())]
+    assert f"0x{removed:04X}" not in texts
+    assert model.item(texts.index("0x1000"), 0) is untouched
+    assert model.item(texts.index("0x1600"), 1).text() == "Renamed mapping"
+    assert model.rowCount() == len(device.objects)
+
+
+@pytest.mark.qt
+def test_scheduled_refreshes_are_coalesced(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    model = widget.model()
+    calls = []
+    original = model._refresh
+    monkeypatch.setattr(model, "_refresh", lambda: (calls.append(1), original()))
+
+    device.get_object(0x1000).name = "Device type (renamed)"
+    for _ in range(5):
+        widget.schedule_refresh()
+    assert calls == []
+
+    qtbot.waitUntil(lambda: calls == [1], timeout=1000)
+    assert model.item(0, 1).text() == "Device type (renamed)"
+
+
+@pytest.mark.qt
+def test_select_entry_uses_row_lookup(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    model = widget.model()
+    row = model.row_for_index(0x1600)
+    assert model.item(row, 0).text() == "0x1600"
+    assert model.row_for_index(0xFFFF) is None
+
+    widget.select_entry(device.get_object(0x1600))
+    assert widget.tree().currentIndex().row() == row
+
+
+@pytest.mark.qt
+def test_update_entry_rewrites_single_row(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    model = widget.model()
+    entry = device.get_object(0x1000)
+    row = model.row_for_index(0x1000)
+    name_item = model.item(row, 1)
+    entry.name = "Device type (edited)"
+
+    with qtbot.waitSignal(model.dataChanged, timeout=1000):
+        widget.update_entry(entry)
+
+    assert model.item(row, 1) is name_item
+    assert name_item.text() == "Device type (edited)"
+
+
+@pytest.mark.qt
+def test_set_device_skips_relayout_when_unchanged(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    expanded = []
+    monkeypatch.setattr(widget.tree(), "expandToDepth", expanded.append)
+    widget.set_device(device)
+    assert expanded == []
+
+    device.get_object(0x1000).name = "Device type (edited)"
+    widget.set_device(device)
+    assert expanded == [0]
+
+
+@pytest.mark.qt
+def test_index_column_uses_fixed_width(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+
+    measured = []
+    monkeypatch.setattr(widget.tree(), "resizeColumnToContents", measured.append)
+    widget.set_device(device)
+
+    assert measured == []
+    metrics = widget.tree().fontMetrics()
+    assert widget.tree().columnWidth(0) >= metrics.horizontalAdvance("0xFFFF")
+
+
+@pytest.mark.qt
+def test_row_selection_emits_once_per_row(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    emitted = []
+    widget.selectionChanged.connect(lambda entry, sub: emitted.append((entry, sub)))
+    widget.select_entry(device.get_object(0x1000))
+
+    assert emitted == [(device.get_object(0x1000), None)]
+
+
+@pytest.mark.qt
+def test_select_entry_skips_current_row(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+    widget.select_entry(device.get_object(0x1000))
+
+    calls = []
+    monkeypatch.setattr(widget.tree(), "setCurrentIndex", calls.append)
+    widget.select_entry(device.get_object(0x1000))
+    assert calls == []
+
+
+@pytest.mark.qt
+def test_select_entry_reselects_after_selection_cleared(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+    widget.select_entry(device.get_object(0x1000))
+    widget.tree().clearSelection()
+
+    widget.select_entry(device.get_object(0x1000))
+
+    selection_model = widget.tree().selectionModel()
+    assert selection_model.isSelected(widget.tree().currentIndex())
+
+
+@pytest.mark.qt
+def test_items_store_index_keys(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    model = widget.model()
+    entry = next(e for e in device.all_entries() if e.sub_objects)
+    parent = model.index(model.row_for_index(entry.index), 0)
+    assert parent.data(Qt.UserRole) == (entry.index, -1)
+    assert model.payload(parent) == (entry, None)
+
+    subindex, sub = entry.sorted_sub_items()[0]
+    child = model.index(0, 0, parent)
+    assert child.data(Qt.UserRole) == (entry.index, subindex)
+    assert model.payload(child) == (entry, sub)
+
+
+@pytest.mark.qt
+def test_flat_tree_skips_expansion(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget(include_subindices=False)
+    qtbot.addWidget(widget)
+
+    expanded = []
+    monkeypatch.setattr(widget.tree(), "expandToDepth", expanded.append)
+    widget.set_device(device)
+    widget.refresh()
+
+    assert expanded == []
+    assert widget.model().rowCount() > 0
+
+
+@pytest.mark.qt
+def test_reselecting_same_entry_is_not_announced_again(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = ObjectDictionaryWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    emitted = []
+    widget.selectionChanged.connect(lambda entry, sub: emitted.append(entry.index))
+    widget.select_entry(device.get_object(0x1000))
+    widget.tree().clearSelection()
+    widget.select_entry(device.get_object(0x1000))
+    widget.select_entry(device.get_object(0x1001))
+
+    assert emitted == [0x1000, 0x1001]
+
+
+def _large_device(count: int = 2000, subs: int = 3) -> Device:
+    device = Device()
+    for offset in range(count):
+        index = 0x2000 + offset
+        entry = ObjectEntry(
+            index=index,
+            name=f"Object {index:04X}",
+            object_type=ObjectType.RECORD,
+            data_type=None,
+            access_type=None,
+        )
+        entry.sub_objects = {
+            subindex: SubObject(
+                key=ObjectKey(index=index, subindex=subindex),
+                name=f"Sub {subindex}",
+                data_type=DataType.UNSIGNED8,
+                access_type=AccessType.RW,
+            )
+            for subindex in range(subs)
+        }
+        device.add_object(entry)
+    return device
+
+
+@pytest.mark.qt
+def test_repeated_large_loads_do_not_drain_none_refcount(qtbot):
+    # Some PySide6 builds drop a reference to None on binding calls; a model
+    # that leans on them aborts the interpreter after a few large reloads.
+    device = _large_device()
+    model = ObjectDictionaryModel()
+
+    before = sys.getrefcount(None)
+    for _ in range(6):
+        model.set_device(device)
+        for entry in device.all_entries():
+            entry.value = "1"
+        model.refresh()
+        for entry in device.all_entries():
+            entry.value = None
+        model.refresh()
+        model.set_device(None)
+        assert model.rowCount() == 0
+    assert sys.getrefcount(None) >= before
+
+
+@pytest.mark.qt
+def test_pending_highlight_cleared_without_losing_cell_data(qtbot):
+    device = _large_device(count=1, subs=0)
+    entry = device.all_entries()[0]
+    model = ObjectDictionaryModel()
+    model.set_device(device)
+    name_index = model.index(0, 1)
+    assert model.data(name_index, Qt.ForegroundRole) is not None
+
+    entry.value = "5"
+    model.update_entry(entry)
+    assert model.data(name_index, Qt.ForegroundRole) is None
+    assert model.data(name_index) == entry.name
+    assert model.itemFromIndex(name_index).isEditable()
+    assert model.data(model.index(0, 4)) == "5"
+
+    entry.value = None
+    model.update_entry(entry)
+    assert model.data(name_index, Qt.ForegroundRole) is not None
+
+
+@pytest.mark.qt
+def test_edited_cell_shows_the_stored_value(qtbot):
+    device = _large_device(count=1, subs=1)
+    entry = device.all_entries()[0]
+    model = ObjectDictionaryModel()
+    model.set_device(device)
+
+    value_index = model.index(0, 4)
+    assert model.setData(value_index, "  42 ")
+    assert entry.value == "42"
+    assert model.data(value_index) == "42"
+
+    name_index = model.index(0, 1)
+    model.setData(name_index, "   ")
+    assert entry.name is None
+    assert model.data(name_index) == "Unnamed Object"
+
+    sub_name_index = model.index(0, 1, model.index(0, 0))
+    model.setData(sub_name_index, " Renamed ")
+    assert entry.sub_objects[0].name == "Renamed"
+    assert model.data(sub_name_index) == "Renamed"
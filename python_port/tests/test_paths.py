@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from canopen_node_editor.app import resolve_paths
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from canopen_node_editor.app import _user_dirs, resolve_paths
 
 
 def test_resolve_paths_uses_project_root(tmp_path):
@@ -12,3 +18,43 @@ def test_resolve_paths_uses_project_root(tmp_path):
     assert paths.root_dir == custom_root
     assert paths.config_dir == custom_root / "config"
     assert paths.data_dir == custom_root / "data"
+
+
+def test_resolve_paths_is_cached(tmp_path):
+    first = resolve_paths(tmp_path)
+
+    assert resolve_paths(tmp_path) is first
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"), reason="XDG variables are ignored here"
+)
+def test_user_dirs_are_persisted(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    cache_file = tmp_path / "canopen_node_editor" / "paths.json"
+
+    config_dir, data_dir = _user_dirs()
+
+    cached = json.loads(cache_file.read_text(encoding="utf-8"))
+    assert cached["config_dir"] == str(config_dir)
+    assert cached["data_dir"] == str(data_dir)
+    assert [path.name for path in cache_file.parent.iterdir()] == ["paths.json"]
+
+    cached.update(config_dir="/cached/config", data_dir="/cached/data")
+    cache_file.write_text(json.dumps(cached), encoding="utf-8")
+    assert _user_dirs() == (Path("/cached/config"), Path("/cached/data"))
+
+
+@pytest.mark.skipif(
+    sys.platform in ("win32", "darwin"), reason="XDG variables are ignored here"
+)
+def test_user_dirs_cache_follows_environment(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "first"))
+    first_config, _ = _user_dirs()
+
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path / "second"))
+    second_config, _ = _user_dirs()
+
+    assert first_config != second_config
+    assert _user_dirs()[0] == second_config
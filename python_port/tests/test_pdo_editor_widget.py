@@ -4,6 +4,7 @@ import pytest
 
 pytest.importorskip("PySide6")
 
+from PySide6.QtCore import Qt
 from PySide6.QtWidgets import QComboBox
 
 from canopen_node_editor.gui.widgets.pdo_editor import PDOEditorWidget
@@ -211,3 +212,90 @@ def test_editing_rpdo_communication_updates_device(qtbot):
     item.setText("128")
 
     assert entry.sub_objects[2].default == "128"
+
+
+@pytest.mark.qt
+def test_set_device_picks_up_edits_to_the_same_device(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = PDOEditorWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    table = widget.rpdo_mapping_view()
+    item = table.item(0, 2)
+    assert item is not None
+    device.get_object(0x1600).name = "Renamed mapping"
+    widget.set_device(device)
+    assert table.item(0, 2) is not item
+
+
+@pytest.mark.qt
+def test_mappable_objects_are_collected_once_per_device_change(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = PDOEditorWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    first = widget._collect_mappable_entries(PDOMapping.RPDO)
+    assert widget._collect_mappable_entries(PDOMapping.RPDO) is first
+
+    device.get_object(0x1600).name = "Renamed mapping"
+    widget.set_device(device)
+    assert widget._collect_mappable_entries(PDOMapping.RPDO) is not first
+
+
+@pytest.mark.qt
+def test_mappable_objects_for_both_directions_share_one_walk(qtbot, monkeypatch):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = PDOEditorWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+    widget._mappable_cache.clear()
+
+    walks = []
+    all_entries = device.all_entries
+    monkeypatch.setattr(device, "all_entries", lambda: walks.append(1) or all_entries())
+    widget._collect_mappable_entries(PDOMapping.RPDO)
+    widget._collect_mappable_entries(PDOMapping.TPDO)
+    assert walks == [1]
+
+@pytest.mark.qt
+def test_only_field_cells_are_editable(qtbot):
+    device = parse_xdd(SAMPLES / "demo_device.xdd")
+
+    widget = PDOEditorWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    table = widget.rpdo_mapping_view()
+    assert table.rowCount() > 0
+    editable = Qt.ItemFlag.ItemIsEditable
+    for row in range(table.rowCount()):
+        assert not table.item(row, 0).flags() & editable
+        assert not table.item(row, 1).flags() & editable
+        assert table.item(row, 2).flags() & editable
+
+
+@pytest.mark.qt
+def test_selector_moves_refill_tables_once_settled(qtbot, monkeypatch):
+    device = Device()
+    for index in (0x1800, 0x1801, 0x1802):
+        device.add_object(
+            ObjectEntry(index, f"TPDO {index:04X}", ObjectType.VAR, DataType.UNSIGNED32, AccessType.RW)
+        )
+
+    widget = PDOEditorWidget()
+    qtbot.addWidget(widget)
+    widget.set_device(device)
+
+    fills = []
+    monkeypatch.setattr(widget, "_populate_section_tables", fills.append)
+    selector = widget.tpdo_selector()
+    for row in (1, 2, 1):
+        selector.setCurrentRow(row)
+    assert fills == []
+
+    qtbot.waitUntil(lambda: fills == [PDOMapping.TPDO], timeout=1000)
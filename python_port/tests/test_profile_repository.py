@@ -1,3 +1,4 @@
+import os
 from pathlib import Path
 
 from canopen_node_editor.services import ProfileRepository
@@ -18,3 +19,23 @@ def test_discovery_from_directory(tmp_path):
     assert {meta.path.name for meta in profiles} == {"demo_device.eds", "demo_device.xdd"}
     product_names = {meta.name for meta in profiles}
     assert "Demo Device" in product_names
+
+
+def test_discover_cached_rescans_after_changes(tmp_path):
+    repo_dir = tmp_path / "profiles"
+    nested = repo_dir / "vendor"
+    nested.mkdir(parents=True)
+    sample = SAMPLES / "demo_device.eds"
+    (repo_dir / "first.eds").write_text(sample.read_text(encoding="utf-8"), encoding="utf-8")
+
+    repository = ProfileRepository([repo_dir])
+    profiles = repository.discover_cached()
+    assert [meta.path.name for meta in profiles] == ["first.eds"]
+    assert repository.discover_cached() is profiles
+
+    (nested / "second.eds").write_text(sample.read_text(encoding="utf-8"), encoding="utf-8")
+    os.utime(nested, ns=(1, 1))
+
+    refreshed = repository.discover_cached()
+    assert refreshed is not profiles
+    assert {meta.path.name for meta in refreshed} == {"first.eds", "second.eds"}
@@ -20,3 +20,19 @@ def test_settings_round_trip(tmp_path):
     manager.save()
     empty = SettingsManager(storage_dir=storage).load()
     assert empty.recent_files == []
+
+
+def test_cached_preferences_reads_file_once(tmp_path):
+    storage = tmp_path / "config"
+    writer = SettingsManager(storage_dir=storage)
+    writer.update_preferences(theme="dark")
+    writer.save()
+
+    manager = SettingsManager(storage_dir=storage)
+    prefs = manager.cached_preferences()
+    assert prefs.theme == "dark"
+
+    manager.storage_path.unlink()
+    manager.update_preferences(theme="light")
+    assert manager.cached_preferences() is prefs
+    assert prefs.theme == "light"